@@ -8,6 +8,29 @@ in a popup message box.
 import pyperclip
 import tkinter as tk
 from tkinter import messagebox
+from typing import Optional
+
+from hw_01.is_number_val import is_number
+
+_root: Optional[tk.Tk] = None
+
+
+def get_hidden_root() -> tk.Tk:
+    """
+    Returns a hidden Tk root window for the message boxes.
+
+    The window is created on the first call and reused afterwards,
+    so Tk is initialized only once per process.
+
+    Returns:
+    tk.Tk: The hidden root window.
+    """
+    global _root
+
+    if _root is None:
+        _root = tk.Tk()
+        _root.withdraw()  # Hide the main window
+    return _root
 
 
 def process_clipboard_and_divide(factor: float = 1.2) -> None:
@@ -33,34 +56,32 @@ def process_clipboard_and_divide(factor: float = 1.2) -> None:
 
     if not clipboard_text:
         print("Clipboard is empty!")
+        get_hidden_root()
         messagebox.showerror("Error", "Clipboard is empty!")
         return
 
-    # Replace commas with dots for decimal separation
-    clipboard_text = clipboard_text.replace(",", ".")
+    # Replace commas with dots for decimal separation and remove extra spaces
+    number: float | None = is_number(clipboard_text.replace(",", ".").strip())
 
-    try:
-        # Try converting the clipboard content to a float
-        number: float = float(clipboard_text.strip())  # Removing extra spaces
-        print(f"Extracted number: {number}")
+    if number is None:
+        print(f"Error: not a valid number: {clipboard_text!r}")
+        get_hidden_root()
+        messagebox.showerror("Error", "The clipboard does not contain a valid number!")
+        return
 
-        # Divide the number by the given factor
-        result: float = number / factor
-        print(f"Result of division: {result}")
+    print(f"Extracted number: {number}")
 
-        # Show the result in a message box
-        root: tk.Tk = tk.Tk()
-        root.withdraw()  # Hide the main window
-        messagebox.showinfo("Result", f"Result of division: {result}")
+    # Divide the number by the given factor
+    result: float = number / factor
+    print(f"Result of division: {result}")
 
-        # Copy the result back to clipboard
-        pyperclip.copy(str(result))
+    # Show the result in a message box
+    get_hidden_root()
+    messagebox.showinfo("Result", f"Result of division: {result}")
+
+    # Copy the result back to clipboard
+    pyperclip.copy(str(result))
 
-    except ValueError as e:
-        print(f"Error: {e}")
-        root: tk.Tk = tk.Tk()
-        root.withdraw()
-        messagebox.showerror("Error", "The clipboard does not contain a valid number!")
 
 if __name__ == "__main__":
     process_clipboard_and_divide()
@@ -1,4 +1,6 @@
-import csv, re
+import csv, re, sys
+
+_DIGIT_COMMA = re.compile(r'(?<=\d),(?=\d)')
 
 
 class Delimiter(csv.Dialect):
@@ -10,10 +12,12 @@ class Delimiter(csv.Dialect):
 
 csv.register_dialect('delimiter', Delimiter)
 
-with open('../data.csv', encoding='utf-8') as csvfile:
-    data = csvfile.read()
-    print(re.sub(r'(?<=\d),(?=\d)', ';', data))
-
-
-
-
+with open('../data.csv', encoding='utf-8', buffering=1 << 20) as csvfile:
+    # Process the file line by line instead of reading it whole
+    write, sub = sys.stdout.write, _DIGIT_COMMA.sub
+    for line in csvfile:
+        # Lines without a comma cannot match, skip the regex for them
+        if ',' not in line:
+            write(line)
+            continue
+        write(sub(';', line))
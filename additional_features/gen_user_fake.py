@@ -13,15 +13,16 @@ def generate_users(count: int = 15) -> List[Dict[str, str]]:
         List[Dict[str, str]]: A list of dictionaries containing user data (name, surname, email).
     """
     fake = Faker('uk_UA')
-    users = []
-    for _ in range(count):
-        user = {
-            "name": fake.first_name(),
-            "surname": fake.last_name(),
-            "email": fake.email()
+    # Resolve the providers once, Faker looks them up through a proxy on every access
+    first_name, last_name, email = fake.first_name, fake.last_name, fake.email
+    return [
+        {
+            "name": first_name(),
+            "surname": last_name(),
+            "email": email()
         }
-        users.append(user)
-    return users
+        for _ in range(count)
+    ]
 
 
 def main() -> None:
@@ -11,12 +11,14 @@ def get_file_from_directory() -> str:
     user_input = input(f"Enter the folder path to select a file for processing (default: {default_path}): ").strip()
     processing_path = user_input or default_path
 
-    if not os.path.isdir(processing_path):
+    # A single directory scan, a missing or non-directory path fails right here
+    try:
+        with os.scandir(processing_path) as entries:
+            processing_files = [entry.name for entry in entries]
+    except (FileNotFoundError, NotADirectoryError):
         print("Error: Invalid directory path.")
         exit()
 
-    processing_files = [f for f in os.listdir(processing_path)]
-
     if not processing_files:
         print("Error: No files found in the selected directory.")
         exit()
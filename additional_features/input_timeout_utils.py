@@ -2,25 +2,105 @@
 This module provides a function that prompts the user for input
 with a specified time limit. If the user doesn't respond within
 the given time, the function returns None and prints a timeout message.
-It uses Python's threading module to handle the input and timeout mechanism simultaneously.
+
+On POSIX systems the standard input is watched with a selector, so waiting
+for the answer is a single select call without extra threads or signals.
+Where the standard input cannot be selected (e.g. on Windows), a single
+background reader thread, started on first use and shared by all calls,
+handles the input while the caller waits with a timeout.
 
 Key features:
 
 User input is captured through a prompt, and a timeout is applied.
-The input is processed in a separate thread, allowing for concurrent waiting for input and checking for a timeout.
+Waiting for input and checking for a timeout happen concurrently.
 If the user provides input within the given time, it is returned; otherwise, a timeout message is displayed.
 """
 
+import os
+import queue
+import selectors
+import sys
 import threading
-import time
-from typing import Optional
+from typing import Optional, Union
 
+_stdin_selector: Optional[selectors.BaseSelector] = None
 
-def input_with_timeout(prompt: str, timeout: int = 5) -> Optional[str]:
+_prompt_queue: "queue.Queue[str]" = queue.Queue()
+# Holds the answers, or the exception that stopped the reader from reading one
+_result_queue: "queue.Queue[Union[str, None, Exception]]" = queue.Queue()
+_reader_thread: Optional[threading.Thread] = None
+# True while the reader thread still waits for an answer to a timed-out prompt
+_reader_pending: bool = False
+
+
+def _get_stdin_selector() -> Optional[selectors.BaseSelector]:
     """
-    Prompts the user for input with a time limit.
+    Returns a selector with the standard input registered for reading.
+
+    The selector is created once and reused by later calls.
+
+    Returns:
+        Optional[selectors.BaseSelector]: The selector, or None if the
+        standard input cannot be watched on this platform.
+    """
+    global _stdin_selector
+
+    if os.name != "posix":
+        return None
+    if _stdin_selector is None:
+        try:
+            selector = selectors.DefaultSelector()
+            selector.register(sys.stdin, selectors.EVENT_READ)
+        except (AttributeError, OSError, ValueError):
+            return None
+        _stdin_selector = selector
+    return _stdin_selector
+
+
+def _read_raw_line() -> Optional[str]:
+    """
+    Reads one line from the raw unbuffered standard input.
+
+    The raw stream is read byte by byte up to the line break, so nothing
+    after the line is consumed and no data is left hidden in the buffer of
+    sys.stdin, where a select call on the file descriptor could not see it.
+    If sys.stdin has been replaced by an object without a raw binary stream
+    (IDLE, Jupyter, a StringIO in tests), the line is read from sys.stdin itself.
+
+    Returns:
+        Optional[str]: The line without its line break, or None at the end of the input.
+    """
+    raw = getattr(getattr(sys.stdin, "buffer", None), "raw", None)
+    if raw is None:
+        text_line = sys.stdin.readline()
+        return text_line.rstrip("\r\n") if text_line else None
+    line = raw.readline()
+    if not line:
+        return None
+    return line.decode(sys.stdin.encoding or "utf-8").rstrip("\r\n")
+
+
+def _reader_loop() -> None:
+    """
+    Reads one line for every prompt put into the prompt queue.
+
+    The line is read from the raw unbuffered stream, so the blocked daemon
+    thread does not hold the stdin buffer lock when the interpreter exits.
+    An error while reading is put into the result queue instead of the
+    answer, so it reaches the caller and the thread keeps serving prompts.
+    """
+    while True:
+        prompt = _prompt_queue.get()
+        try:
+            print(prompt, end="", flush=True)
+            _result_queue.put(_read_raw_line())
+        except Exception as e:
+            _result_queue.put(e)
+
 
-    Uses threading to wait for input and a timeout mechanism.
+def _threaded_input(prompt: str, timeout: int) -> Optional[str]:
+    """
+    Waits for user input read by the shared background thread.
 
     Args:
         prompt (str): The message to display to the user.
@@ -29,30 +109,70 @@ def input_with_timeout(prompt: str, timeout: int = 5) -> Optional[str]:
     Returns:
         Optional[str]: The input entered by the user, or None if the input times out.
 
-    Example:
-        >>> input_with_timeout("Enter something: ", 5)
-        Enter something: (User input or 'Time is up!' message)
+    Raises:
+        Exception: The error the reader thread got while reading the input.
     """
+    global _reader_thread, _reader_pending
+
+    if _reader_thread is None:
+        _reader_thread = threading.Thread(target=_reader_loop, daemon=True)
+        _reader_thread.start()
+
+    if _reader_pending:
+        # The reader is still blocked on the previous prompt, its answer counts for this one
+        print(prompt, end="", flush=True)
+    else:
+        _prompt_queue.put(prompt)
+
+    try:
+        result = _result_queue.get(timeout=timeout)
+    except queue.Empty:
+        _reader_pending = True
+        return None
+
+    _reader_pending = False
+    if isinstance(result, Exception):
+        raise result
+    return result
 
-    def timed_input(result: list) -> None:
-        """Helper function to capture input within a timeout."""
-        result.append(input(prompt))
 
-    # Create a list to store the result of input
-    result: list = []
+def input_with_timeout(prompt: str, timeout: int = 5) -> Optional[str]:
+    """
+    Prompts the user for input with a time limit.
 
-    # Start a thread to prompt the user for input
-    input_thread = threading.Thread(target=timed_input, args=(result,))
-    input_thread.start()
+    Waits for the standard input with a selector where possible
+    and falls back to the shared reader thread otherwise.
 
-    # Wait for the input thread to finish or for the timeout to occur
-    input_thread.join(timeout)
+    Args:
+        prompt (str): The message to display to the user.
+        timeout (int): The time limit (in seconds) for user input.
+
+    Returns:
+        Optional[str]: The input entered by the user, or None if the input times out
+        or the standard input is closed.
+
+    Raises:
+        Exception: An error the background reader thread got while reading the input.
+
+    Example:
+        >>> input_with_timeout("Enter something: ", 5)
+        Enter something: (User input or 'Time is up!' message)
+    """
+    selector = _get_stdin_selector()
 
-    if result:
-        return result[0]  # User provided input
+    if selector is None:
+        result = _threaded_input(prompt, timeout)
     else:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        if selector.select(timeout):
+            result = _read_raw_line()
+        else:
+            result = None
+
+    if result is None:
         print("Time is up!")
-        return None  # Timeout occurred
+    return result
 
 
 if __name__ == "__main__":
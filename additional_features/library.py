@@ -1,17 +1,22 @@
-import xml.etree.ElementTree as ET
+from lxml import etree
 
-root = ET.Element('books')
+books = [
+    {'title': 'The Hobbit', 'description': 'Some description'},
+    {'title': 'LOTR', 'description': 'Some description 2'},
+]
 
-book_1 = ET.SubElement(root, 'book_1')
-ET.SubElement(book_1, 'title').text = 'The Hobbit'
-ET.SubElement(book_1, 'description').text = 'Some description'
+# Write the elements one by one instead of building the whole tree in memory
+with etree.xmlfile('books.xml') as xf:
+    with xf.element('books'):
+        for number, book in enumerate(books, start=1):
+            with xf.element(f'book_{number}'):
+                for field, text in book.items():
+                    element = etree.Element(field)
+                    element.text = text
+                    xf.write(element)
 
-book_2 = ET.SubElement(root, 'book_2')
-ET.SubElement(book_1, 'title').text = 'LOTR'
-ET.SubElement(book_1, 'description').text = 'Some description 2'
-
-tree = ET.ElementTree(root)
-tree.write('books.xml')
-
-tree = ET.parse('../books.xml')
-root = tree.getroot()
+# Read the books back, releasing each parsed book right after use
+for _, element in etree.iterparse('../books.xml', events=('end',)):
+    if element.tag.startswith('book_'):
+        print(element.tag, element.findtext('title'), element.findtext('description'))
+        element.clear()
@@ -1,34 +1,22 @@
-class NameDescriptor:
-    def __set__(self, instance, value):
-        instance.__dict__['name'] = value.strip()
-    def __get__(self, instance, value):
-        return instance.__dict__['name']
-    def __delete__(self, instance):
-        delattr(self, instance.__dict__['name'])
-
-
-class EmailDescriptor:
-    def __set__(self, instance, value):
-        instance.__dict__['email'] = value.strip()
-    def __get__(self, instance, value):
-        return instance.__dict__['email']
-    def __delete__(self, instance):
-        delattr(self, instance.__dict__['email'])
+class StrippedStr:
+    __slots__ = ('name',)
 
-
-class AddressDescriptor:
+    def __set_name__(self, owner, name):
+        self.name = name
     def __set__(self, instance, value):
-        instance.__dict__['address'] = value.strip()
-    def __get__(self, instance, value):
-        return instance.__dict__['address']
+        instance.__dict__[self.name] = value.strip()
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.__dict__[self.name]
     def __delete__(self, instance):
-        delattr(self, instance.__dict__['address'])
+        del instance.__dict__[self.name]
 
 
 class Person:
-    name = NameDescriptor()
-    email = EmailDescriptor()
-    address = AddressDescriptor()
+    name = StrippedStr()
+    email = StrippedStr()
+    address = StrippedStr()
 
     def __init__(self, name, email, address):
         self.name = name
@@ -0,0 +1,44 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# student_csv imports get_file_from_directory from this folder
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hw_06.CSV.student_csv import Student, avg_grade, read_students
+
+
+class TestReadStudents(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.temp_dir.name, 'students.csv')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_csv(self, content):
+        with open(self.file_name, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+
+    def test_read_students(self):
+        self.write_csv("Ім'я,Вік,Оцінка\nПетро,21,90\nМарина,22,85\n")
+        self.assertEqual(read_students(self.file_name),
+                         [Student('Петро', 21, 90), Student('Марина', 22, 85)])
+
+    def test_read_students_blank_line(self):
+        self.write_csv("Ім'я,Вік,Оцінка\nПетро,21,90\n\nМарина,22,85\n")
+        students = read_students(self.file_name)
+        self.assertEqual(students, [Student('Петро', 21, 90), Student('Марина', 22, 85)])
+        self.assertEqual(avg_grade(students), 87.5)
+
+    def test_avg_grade_empty(self):
+        self.assertEqual(avg_grade([]), 0.0)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,17 @@
 # Suppose this is foo.py.
 
-print("before import")
 import math
 
-print("before function_a")
+_sqrt = math.sqrt
+
+
 def function_a():
     print("Function A")
 
-print("before function_b")
+
 def function_b():
-    print("Function B {}".format(math.sqrt(100)))
-print("before function_main")
+    print("Function B {}".format(_sqrt(100)))
+
 
 def main():
     print("_&_" * 11)
@@ -18,10 +19,16 @@ def main():
     function_a()
     function_b()
     print("_&_" * 11)
-print("before __name__ guard")
 
+
+# The tracing prints run only when the file is executed, not on import
 if __name__ == '__main__':
+    print("before import")
+    print("before function_a")
+    print("before function_b")
+    print("before function_main")
+    print("before __name__ guard")
     function_a()
     function_b()
     main()
-print("after __name__ guard")
\ No newline at end of file
+    print("after __name__ guard")
@@ -12,7 +12,8 @@ Functions:
 """
 
 import sqlite3
-from typing import List, Tuple
+import sys
+from typing import List, Optional, Tuple
 
 StudentRecord = Tuple[str, str, str, str]
 
@@ -25,6 +26,66 @@ students_list: List[StudentRecord] = [
 ]
 
 
+INSERT_SQL = 'INSERT INTO students (surname, name, phone, specialty) VALUES '
+ROW_PLACEHOLDERS = '(?, ?, ?, ?)'
+ROW_COLUMNS = 4
+# Upper bound of rows in one multi-row statement
+BULK_INSERT_CHUNK = 500
+# Default limit of bound variables in SQLite before 3.32
+SQLITE_OLD_MAX_VARIABLES = 999
+
+
+def _bulk_insert_chunk_size(conn: sqlite3.Connection) -> int:
+    """
+    Returns how many rows fit into one INSERT statement on this connection.
+
+    The number of bound variables per statement is limited by SQLite, to 999
+    by default before version 3.32 and to 32766 since then. Where Python cannot
+    read the limit (before 3.11), the old default is assumed.
+
+    Args:
+        conn (sqlite3.Connection): The database connection.
+
+    Returns:
+        int: The number of rows in one multi-row statement.
+    """
+    try:
+        max_variables = conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:  # Connection.getlimit() is available since Python 3.11
+        max_variables = SQLITE_OLD_MAX_VARIABLES
+    return max(1, min(BULK_INSERT_CHUNK, max_variables // ROW_COLUMNS))
+
+
+def _bulk_insert(cursor: sqlite3.Cursor, rows: List[StudentRecord],
+                 chunk_size: Optional[int] = None) -> None:
+    """
+    Inserts student records with multi-row INSERT statements.
+
+    Full chunks of rows are inserted by one statement each; the remaining
+    rows, fewer than a chunk, are inserted with executemany.
+
+    Args:
+        cursor (sqlite3.Cursor): The cursor to execute the statements with.
+        rows (List[StudentRecord]): The student records to insert.
+        chunk_size (Optional[int]): The number of rows in one multi-row statement.
+            Defaults to as many as the connection's limit of bound variables allows.
+
+    Returns:
+        None
+    """
+    if chunk_size is None:
+        chunk_size = _bulk_insert_chunk_size(cursor.connection)
+    full_chunks_end = len(rows) - len(rows) % chunk_size
+    if full_chunks_end:
+        chunk_sql = INSERT_SQL + ', '.join([ROW_PLACEHOLDERS] * chunk_size)
+        for start in range(0, full_chunks_end, chunk_size):
+            chunk = rows[start:start + chunk_size]
+            cursor.execute(chunk_sql, [value for row in chunk for value in row])
+
+    if full_chunks_end < len(rows):
+        cursor.executemany(INSERT_SQL + ROW_PLACEHOLDERS, rows[full_chunks_end:])
+
+
 def create_and_populate_db(db_name: str, students: List[StudentRecord]) -> None:
     """
     Creates a database, sets up a table, inserts student records, and deletes some records.
@@ -39,28 +100,43 @@ def create_and_populate_db(db_name: str, students: List[StudentRecord]) -> None:
     conn = sqlite3.connect(db_name)
     cursor = conn.cursor()
 
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS students (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        surname TEXT NOT NULL,
-        name TEXT NOT NULL,
-        phone TEXT,
-        specialty TEXT
-    )''')
-    conn.commit()
+    # Tune the connection for a bulk load; WAL mode must be set outside a transaction
+    cursor.executescript('''
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    ''')
+
+    # Run the whole load as one transaction, committed once on exit
+    with conn:
+        cursor.execute('BEGIN')
+        # A plain INTEGER PRIMARY KEY is an alias of the rowid: without AUTOINCREMENT
+        # no sqlite_sequence row has to be updated for every insert
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY,
+            surname TEXT NOT NULL,
+            name TEXT NOT NULL,
+            phone TEXT,
+            specialty TEXT
+        )''')
+
+        _bulk_insert(cursor, students)
 
-    cursor.executemany('''
-    INSERT INTO students (surname, name, phone, specialty) VALUES (?, ?, ?, ?)
-    ''', students_list)
-    conn.commit()
+        cursor.execute('DELETE FROM students WHERE id > 5')
 
-    cursor.execute('DELETE FROM students WHERE id > 5')
-    conn.commit()
+    # Collect table statistics for the query planner once the load is done
+    cursor.execute('ANALYZE')
 
+    # Plain tuples are the cheapest rows, no named access is needed here
+    cursor.row_factory = None
+    cursor.arraysize = 4096
     cursor.execute('SELECT * FROM students')
-    rows = cursor.fetchall()
-    for row in rows:
-        print(row)
+    # Print the rows batch by batch, one write per batch instead of one print() per row
+    write = sys.stdout.write
+    while batch := cursor.fetchmany():
+        write("\n".join(map(repr, batch)) + "\n")
 
     cursor.close()
     conn.close()
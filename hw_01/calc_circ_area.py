@@ -1,34 +1,44 @@
+import re
 from math import pi
 
+# Decimal notation accepted by float(): optional sign, digits with an optional
+# fraction part and an optional exponent, surrounded by optional whitespace
+_NUM_RE = re.compile(r'\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\s*')
 
-def calculate_circle_area(radius: float) -> float:
+
+def calculate_circle_area(radius: float, _pi: float = pi) -> float:
     """
     Calculate the area of a circle.
 
     Args:
         radius (float): The radius of the circle. Must be a positive number.
+        _pi (float): The value of π bound as a local name. Not meant to be passed.
 
     Returns:
         float: The area of the circle, calculated as π * radius^2.
     """
-    return pi * radius ** 2
+    return _pi * radius * radius
 
 
 def is_number(value: str) -> bool:
     """
-    Check if the given value can be converted to a number.
+    Check if the given value is a number in decimal notation.
+
+    The value is matched against a precompiled pattern, so invalid input
+    does not raise and catch an exception.
+
+    Accepted are an optional sign, digits with an optional decimal point
+    (such as '5', '5.', '.5' or '-1.25') and an optional exponent ('1e3', '2E-4'),
+    with surrounding whitespace allowed. Strings float() also accepts, such as
+    'inf', 'nan' or '1_000', are rejected.
 
     Args:
         value (str): The input value to check.
 
     Returns:
-        bool: True if the value can be converted to a float, False otherwise.
+        bool: True if the value is a number in this notation, False otherwise.
     """
-    try:
-        float(value)
-        return True
-    except ValueError:
-        return False
+    return _NUM_RE.fullmatch(value) is not None
 
 
 # execute only in this file
@@ -1,14 +1,24 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
 def is_number(value: str) -> float | None:
     """
     Checks if the value can be converted to a number.
     If so, returns the converted value, otherwise None.
 
+    Results are memoized, so repeated values skip the conversion
+    and the exception handling entirely. Empty and whitespace-only
+    strings are rejected without calling float().
+
     Args:
         value (str): The input value to check.
 
     Returns:
         float | None: A numeric value or None if this is not possible.
     """
+    if not value or value.isspace():
+        return None
     try:
         return float(value)
     except ValueError:
@@ -1,4 +1,4 @@
-import inspect
+from types import FunctionType
 
 def analyze_inheritance(cls: type) -> None:
     """
@@ -15,14 +15,25 @@ def analyze_inheritance(cls: type) -> None:
 
     # Avoid duplication of methods
     inherited_methods = set()
+    own_attributes = cls.__dict__
 
     # Iterate over each base class
     for parent in parents:
-        # Get methods of the base class
-        for name, method in inspect.getmembers(parent, inspect.isfunction):
-            # Check if the method is not overridden in the child class
-            if name not in cls.__dict__:
-                inherited_methods.add((name, parent.__name__))
+        # Get methods of the base class, including the ones it inherits itself;
+        # the first namespace in the MRO that defines a name wins
+        seen = set()
+        for klass in parent.__mro__:
+            for name, method in klass.__dict__.items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                # A staticmethod is a function when looked up on the class, as inspect.getmembers()
+                # sees it; a classmethod is a bound method there and is not reported
+                if isinstance(method, staticmethod):
+                    method = method.__func__
+                # Check if the method is not overridden in the child class
+                if isinstance(method, FunctionType) and name not in own_attributes:
+                    inherited_methods.add((name, parent.__name__))
 
     # Output inherited methods
     print(f"Class {cls.__name__} inherits:")
@@ -1,5 +1,9 @@
 import inspect
 import importlib
+import os
+import sys
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
 
 def analyze_module(module_name: str) -> None:
@@ -19,37 +23,75 @@ def analyze_module(module_name: str) -> None:
         print(f"Module '{module_name}' not found.")
         return
 
+    # The modification time of the module file invalidates the cached report
+    module_file: Optional[str] = getattr(module, '__file__', None)
+    mtime: Optional[float] = None
+    if module_file:
+        try:
+            mtime = os.path.getmtime(module_file)
+        except OSError:
+            # Loaded from a zip, frozen, or the file is gone: nothing tells whether
+            # a cached report is still valid, so the report is built without the cache
+            sys.stdout.write(describe_module.__wrapped__(module_name, None))
+            return
+
+    sys.stdout.write(describe_module(module_name, mtime))
+
+
+@lru_cache(maxsize=128)
+def describe_module(module_name: str, mtime: Optional[float]) -> str:
+    """
+    Builds the analysis report of an imported module.
+
+    Results are cached by the module name and the modification time of its file,
+    so repeated analysis of an unchanged module returns the ready report.
+
+    Args:
+        module_name (str): The name of an already imported module.
+        mtime (Optional[float]): The modification time of the module file, if any.
+
+    Returns:
+        str: The report with the functions and classes of the module.
+    """
+    module = sys.modules[module_name]
+    lines = []
+
+    # Walk the module namespace once, without dir() and getattr() for every name
+    members = sorted(vars(module).items(), key=itemgetter(0))
+
     # Output all functions with their signatures and parameter annotations
-    functions = [obj for name, obj in inspect.getmembers(module, inspect.isroutine)]
+    functions = [(name, obj) for name, obj in members if inspect.isroutine(obj)]
 
     if functions:
-        print("Functions:")
-        for name, obj in inspect.getmembers(module, inspect.isroutine):
+        lines.append("Functions:")
+        for name, obj in functions:
             try:
                 signature = inspect.signature(obj)
                 cleaned_params = ', '.join(
-                    param.name for param in signature.parameters.values() if param.default == inspect.Parameter.empty
+                    param.name for param in signature.parameters.values() if param.default is inspect.Parameter.empty
                 )
-                print(f"- {name}({cleaned_params})")
+                lines.append(f"- {name}({cleaned_params})")
             except ValueError:
-                print(f"- {name}()")
+                lines.append(f"- {name}()")
     else:
-        print("No functions found.")
+        lines.append("No functions found.")
 
     # Output all classes with their signatures
-    classes = [obj for name, obj in inspect.getmembers(module, inspect.isclass) if not name.startswith('__')]
+    classes = [(name, obj) for name, obj in members if inspect.isclass(obj) and not name.startswith('__')]
     if classes:
-        print(f"\nClasses in module '{module_name}':")
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if not name.startswith('__'):
-                print(f"  Class: {name}")
-                try:
-                    signature = str(inspect.signature(obj))
-                    print(f"    Signature: {signature}")
-                except ValueError:
-                    print("    Signature: Unable to retrieve")
+        lines.append(f"\nClasses in module '{module_name}':")
+        for name, obj in classes:
+            lines.append(f"  Class: {name}")
+            try:
+                signature = str(inspect.signature(obj))
+                lines.append(f"    Signature: {signature}")
+            except ValueError:
+                lines.append("    Signature: Unable to retrieve")
     else:
-        print(f"\nModule '{module_name}' has no classes.")
+        lines.append(f"\nModule '{module_name}' has no classes.")
+
+    lines.append("")
+    return "\n".join(lines)
 
 if __name__ == "__main__":
     module_name: str = input("Input module name: ")
@@ -6,20 +6,26 @@ def analyze_object(val: Any) -> None:
     Analyzes an object and prints:
     - Type of the object.
     - List of all attributes and methods.
-    - Type of each attribute or method.
+    - Type of each attribute or method, as stored in the instance
+      or class namespace (methods are reported as functions).
 
     Parameters:
         val (Any): The object to analyze.
     """
     print("Type of object:", type(val))
     print("\nAttributes and methods:")
-    for attr in dir(val):
-        try:
-            # Create the variable to avoid calling getattr twice
-            attr_value = getattr(val, attr)
-            print(f"- {attr}: {type(attr_value)}")
-        except Exception as err:
-            print(f"Error retrieving attribute {attr}: {err}")
+
+    # Read the namespaces directly, so no descriptors or properties are invoked
+    attr_types = {}
+    for klass in type(val).__mro__:
+        for attr, attr_value in klass.__dict__.items():
+            attr_types.setdefault(attr, type(attr_value))
+    # Instance attributes shadow the class ones
+    for attr, attr_value in getattr(val, '__dict__', {}).items():
+        attr_types[attr] = type(attr_value)
+
+    for attr in sorted(attr_types):
+        print(f"- {attr}: {attr_types[attr]}")
 
 
 class MyClass:
@@ -25,14 +25,18 @@ class AutoMethodMeta(type):
         """
         def make_getter(attr_name: str):
             """Generate a getter method for the given attribute name."""
+            private_name = f"_{attr_name}"
+
             def getter(self):
-                return getattr(self, f"_{attr_name}")
+                return getattr(self, private_name)
             return getter
 
         def make_setter(attr_name: str):
             """Generate a setter method for the given attribute name."""
+            private_name = f"_{attr_name}"
+
             def setter(self, value):
-                setattr(self, f"_{attr_name}", value)
+                setattr(self, private_name, value)
             return setter
 
         new_cls = super().__new__(cls, name, bases, dct)
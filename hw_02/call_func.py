@@ -1,6 +1,8 @@
 import inspect
 from typing import Any
 
+_MISSING = object()
+
 
 def is_callable_obj(obj: Any) -> None:
     """
@@ -48,14 +50,13 @@ def call_function(obj: Any, method_name: str, *args: Any) -> Any:
         AttributeError: If the method does not exist.
         TypeError: If the attribute is not callable or arguments do not match the method's signature.
     """
-    # Check if the method exists
-    if not hasattr(obj, method_name):
+    # Look the method up once, the sentinel tells a missing attribute apart
+    method = getattr(obj, method_name, _MISSING)
+    if method is _MISSING:
         raise AttributeError(
             f"'{type(obj).__name__}' object has no attribute '{method_name}'"
         )
 
-    method = getattr(obj, method_name)
-
     if not callable(method):
         raise TypeError(
             f"'{method_name}' is not a callable method of {type(obj).__name__}"
@@ -1,17 +1,22 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
 
-def create_class(class_name: str, methods: Dict[str, Any]) -> type:
+def create_class(class_name: str, methods: Dict[str, Any],
+                 slots: Optional[Iterable[str]] = None) -> type:
     """
     Dynamically creates a class with the specified name and methods.
 
     Args:
         class_name (str): The name of the class to be created.
         methods (Dict[str, Any]): A dictionary of method names and their corresponding functions.
+        slots (Optional[Iterable[str]]): Names of instance attributes. If given, the class
+            gets __slots__, so its instances have no per-instance __dict__.
 
     Returns:
         type: The dynamically created class.
     """
-    return type(class_name, (object,), methods)
+    if slots is None:
+        return type(class_name, (object,), methods)
+    return type(class_name, (object,), {**methods, "__slots__": tuple(slots)})
 
 def say_hello(self) -> str:
     """
@@ -36,7 +41,7 @@ methods = {
     "say_goodbye": say_goodbye
 }
 
-MyDynamicClass = create_class("MyDynamicClass", methods)
+MyDynamicClass = create_class("MyDynamicClass", methods, slots=())
 
 if __name__ == "__main__":
     obj = MyDynamicClass()
@@ -1,9 +1,40 @@
 from typing import Any
 
 
+class _DynamicProperty:
+    """
+    A shared data descriptor used for every dynamically added property.
+
+    Stores the property name and its default value in fixed slots, so
+    an access is a single lookup in the owner's _properties dictionary
+    without closure cells or a fresh property() object per call.
+
+    Attributes:
+        name (str): The name of the property.
+        default (Any): The value returned when the property is not set.
+    """
+
+    __slots__ = ('name', 'default')
+
+    def __init__(self, name: str, default: Any) -> None:
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return instance._properties[self.name]
+        except KeyError:
+            return self.default
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance._properties[self.name] = value
+
+
 class DynamicProperties:
     """
-    A class that allows dynamic addition of properties at runtime using built-in property() function.
+    A class that allows dynamic addition of properties at runtime.
 
     Attributes:
         _properties (dict): Internal dictionary to store property values.
@@ -24,15 +55,13 @@ class DynamicProperties:
         Returns:
             None
         """
-
-        def getter(self):
-            return self._properties.get(name, default_value)
-
-        def setter(self, value):
-            self._properties[name] = value
+        descriptor = self.__class__.__dict__.get(name)
+        if isinstance(descriptor, _DynamicProperty):
+            descriptor.default = default_value
+            return
 
         # Add the property dynamically
-        setattr(self.__class__, name, property(getter, setter))
+        setattr(self.__class__, name, _DynamicProperty(name, default_value))
 
 
 # Example usage:
@@ -27,8 +27,8 @@ class LimitedAttributesMeta(type):
             TypeError: If the class has more than 3 non-dunder attributes.
         """
         # Count non-dunder attributes
-        non_dunder_attrs = [key for key in dct if not key.startswith('__')]
-        if len(non_dunder_attrs) > 3:
+        non_dunder_count = sum(key[:2] != '__' for key in dct)
+        if non_dunder_count > 3:
             raise TypeError(f"Class '{name}' cannot have more than 3 attributes.")
         return super().__new__(cls, name, bases, dct)
 
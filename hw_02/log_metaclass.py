@@ -1,15 +1,43 @@
+import atexit
+import logging
+from collections import deque
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+# Ring buffer of (action, attribute) records; the oldest records are dropped when full
+_log_buffer: deque = deque(maxlen=8192)
+
+
+def flush_log_buffer() -> None:
+    """
+    Format the buffered attribute records and pass them to the module logger.
+
+    Called automatically at interpreter exit, can also be called at any time.
+    """
+    records = list(_log_buffer)
+    _log_buffer.clear()
+    if records and logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join(f"Logging: {action} '{attr}'" for action, attr in records))
+
+
+atexit.register(flush_log_buffer)
+
 
 class LoggingMeta(type):
     """
     A metaclass that adds logging for attribute access and modification.
 
     Attributes:
+        enabled (bool): Switches the logging wrappers on or off.
+
         Any access or modification of attributes in classes using this metaclass
-        will be logged to the console.
+        is recorded in a ring buffer, which flush_log_buffer() writes
+        to the module logger in one pass.
     """
 
+    enabled: bool = True
+
     def __new__(cls: type, name: str, bases: tuple, dct: dict) -> type:
         """
         Create a new class and add logging to attribute access and modification.
@@ -40,13 +68,19 @@ class LoggingMeta(type):
         original_getattribute = cls.__getattribute__
         original_setattr = cls.__setattr__
 
-        def logging_getattribute(self, attr: str) -> Any:
-            print(f"Logging: accessed '{attr}'")
-            return original_getattribute(self, attr)
+        def logging_getattribute(self, attr: str,
+                                 _getattribute=original_getattribute,
+                                 _append=_log_buffer.append) -> Any:
+            if LoggingMeta.enabled:
+                _append(("accessed", attr))
+            return _getattribute(self, attr)
 
-        def logging_setattr(self, name: str, value: Any) -> None:
-            print(f"Logging: modified '{name}'")
-            original_setattr(self, name, value)
+        def logging_setattr(self, name: str, value: Any,
+                            _setattr=original_setattr,
+                            _append=_log_buffer.append) -> None:
+            if LoggingMeta.enabled:
+                _append(("modified", name))
+            _setattr(self, name, value)
 
         cls.__getattribute__ = logging_getattribute
         cls.__setattr__ = logging_setattr
@@ -66,7 +100,9 @@ class MyClass(metaclass=LoggingMeta):
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     obj = MyClass("Python")       # Logging: modified attribute 'name' with value 'Python'
     print(obj.name)               # Logging: accessed attribute 'name'
     obj.name = "New Python"       # Logging: modified attribute 'name' with value 'New Python'
+    flush_log_buffer()
 
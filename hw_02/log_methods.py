@@ -1,10 +1,16 @@
+import logging
 from typing import Any, Callable
 
+logger = logging.getLogger(__name__)
+
 
 def log_methods(cls: type) -> type:
     """
     Decorator for logging calls to class methods.
 
+    Calls are logged at the DEBUG level of the module logger; when that level
+    is disabled, the message is not formatted at all.
+
     Args:
         cls (Type): The class whose methods will be wrapped for logging.
 
@@ -24,10 +30,12 @@ def log_methods(cls: type) -> type:
             Callable: The wrapped method.
         """
 
-        def wrapped_method(self: Any, *args: Any) -> None:
-            """Logs method calls and executes the original method."""
-            print(f"Logging: {name} called with {args}")
-            method(self, *args)
+        def wrapped_method(self: Any, *args: Any, _name: str = name,
+                           _method: Callable = method) -> Any:
+            """Logs method calls and returns the result of the original method."""
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Logging: %s called with %s", _name, args)
+            return _method(self, *args)
 
         return wrapped_method
 
@@ -54,6 +62,7 @@ class MyClass:
         return a - b
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     obj = MyClass()
     obj.add(5, 3)  # Logging: add called with args: (5, 3)
     obj.subtract(5, 3)  # Logging: subtract called with args: (5, 3)
\ No newline at end of file
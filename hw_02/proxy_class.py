@@ -1,5 +1,28 @@
 from typing import Any
 
+
+class _MethodWrapper:
+    """
+    A callable that logs calls and arguments before delegating to a method.
+    """
+    __slots__ = ('_name', '_attr')
+
+    def __init__(self, name: str, attr: Any) -> None:
+        """
+        Initialize the wrapper with the method name and the method itself.
+
+        Args:
+            name (str): The name of the wrapped method.
+            attr (Any): The bound method of the target object.
+        """
+        self._name = name
+        self._attr = attr
+
+    def __call__(self, *args: Any) -> Any:
+        print(f"Calling method: \n{self._name} with args: {args}")
+        return self._attr(*args)
+
+
 class Proxy:
     """
     A proxy class that intercepts attribute access and method calls on the target object.
@@ -22,17 +45,21 @@ class Proxy:
 
         Returns:
             Any: The attribute or method from the target object. If it is a method,
-            it returns a wrapped version that logs calls and arguments.
+            it returns a wrapped version that logs calls and arguments. The wrapper
+            is cached on the proxy instance.
         """
-        # Check if an attribute or method with the same name exists in the target object
-        if not hasattr(self._target, name):
-            raise AttributeError(f"'{self._target.__class__.__name__}' object has no attribute '{name}'")
+        try:
+            attr = getattr(self._target, name)
+        except AttributeError:
+            raise AttributeError(
+                f"'{self._target.__class__.__name__}' object has no attribute '{name}'"
+            ) from None
 
-        attr = getattr(self._target, name)
         if callable(attr):
-            def wrapper(*args: Any) -> Any:
-                print(f"Calling method: \n{name} with args: {args}")
-                return attr(*args)
+            # Store the wrapper on the proxy, so the next access finds it
+            # in the instance dict and does not reach __getattr__ again
+            wrapper = _MethodWrapper(name, attr)
+            object.__setattr__(self, name, wrapper)
             return wrapper
         return attr
 
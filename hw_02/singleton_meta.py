@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Dict
 
 
@@ -7,9 +8,11 @@ class SingletonMeta(type):
 
     Attributes:
         _instances (Dict[type, Any]): Dictionary that stores only the single instance of each class.
+        _lock (threading.RLock): Guards the creation of a missing instance.
     """
 
     _instances: Dict[type, Any] = {}
+    _lock: threading.RLock = threading.RLock()
 
     def __call__(cls, *args: Any) -> Any:
         """
@@ -22,12 +25,19 @@ class SingletonMeta(type):
         Returns:
             Any: The single instance of the class.
         """
-        if cls not in cls._instances:
-            # If an instance does not exist, create and store it
-            instance = super().__call__(*args)
-            cls._instances[cls] = instance
-            print("Creating instance")
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+
+        with cls._lock:
+            # Check again, another thread may have created the instance meanwhile
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = super().__call__(*args)
+                cls._instances[cls] = instance
+                if __debug__:
+                    print("Creating instance")
+        return instance
 
 
 class Singleton(metaclass=SingletonMeta):
@@ -22,17 +22,20 @@ class TypeCheckedMeta(type):
         Returns:
             type: The newly created class.
         """
-        annotations = dct.get('__annotations__', {})
-
-        # Add __setattr__ for instance-level type checking
-        def instance_setattr(self, name: str, value: Any) -> None:
-            expected_type = getattr(self, '_type_annotations', {}).get(name, None)
-            if expected_type and not isinstance(value, expected_type):
+        annotations = dict(dct.get('__annotations__', {}))
+
+        # Add __setattr__ for instance-level type checking;
+        # the annotations and object.__setattr__ are bound as locals
+        def instance_setattr(self, name: str, value: Any,
+                             _annotations=annotations,
+                             _setattr=object.__setattr__) -> None:
+            expected_type = _annotations.get(name)
+            if expected_type is not None and not isinstance(value, expected_type):
                 raise TypeError(
                     f"For attribute '{name}' expected tipe is '{expected_type.__name__}', "
                     f"but now the type is '{type(value).__name__}'."
                 )
-            super(self.__class__, self).__setattr__(name, value)
+            _setattr(self, name, value)
 
         dct['__setattr__'] = instance_setattr
         cls_obj = super().__new__(cls, name, bases, dct)
@@ -6,6 +6,8 @@ class BinaryNumber:
         value (str): The binary number represented as a string of '0' and '1'.
     """
 
+    __slots__ = ('_value', '_int', '_len')
+
     def __init__(self, value: str):
         """
         Initialize a binary number.
@@ -16,10 +18,47 @@ class BinaryNumber:
         Raises:
             ValueError: If the provided value contains characters other than '0' or '1'.
         """
-        if not all(c in '01' for c in value):
-            raise ValueError("The value must be a binary number (only '0' and '1').")
         self.value = value
 
+    @property
+    def value(self) -> str:
+        """
+        The binary number as a string of '0' and '1'.
+
+        The string is built from the integer form on first access only,
+        so chained operations on long numbers skip the conversion.
+        """
+        if self._value is None:
+            self._value = format(self._int, f'0{self._len}b')
+        return self._value
+
+    @value.setter
+    def value(self, value: str) -> None:
+        if not set(value) <= {'0', '1'}:
+            raise ValueError("The value must be a binary number (only '0' and '1').")
+        self._value = value
+        # Keep the parsed form, so the operators do not parse the string again
+        self._int = int(value, 2) if value else 0
+        self._len = len(value)
+
+    @classmethod
+    def _from_int(cls, number: int, length: int) -> "BinaryNumber":
+        """
+        Create a binary number from an already computed integer.
+
+        Args:
+            number (int): The non-negative integer value.
+            length (int): The number of digits of the binary string.
+
+        Returns:
+            BinaryNumber: A new BinaryNumber object without string validation.
+        """
+        obj = cls.__new__(cls)
+        obj._value = None
+        obj._int = number
+        obj._len = length
+        return obj
+
     def __and__(self, other: "BinaryNumber") -> "BinaryNumber":
         """
         Perform bitwise AND operation between two binary numbers.
@@ -30,11 +69,7 @@ class BinaryNumber:
         Returns:
             BinaryNumber: A new BinaryNumber object as the result.
         """
-        max_len = max(len(self.value), len(other.value))
-        self_padded = self.value.zfill(max_len)
-        other_padded = other.value.zfill(max_len)
-        result = ''.join('1' if self_padded[i] == '1' and other_padded[i] == '1' else '0' for i in range(max_len))
-        return BinaryNumber(result)
+        return BinaryNumber._from_int(self._int & other._int, max(self._len, other._len))
 
     def __or__(self, other: "BinaryNumber") -> "BinaryNumber":
         """
@@ -46,11 +81,7 @@ class BinaryNumber:
         Returns:
             BinaryNumber: A new BinaryNumber object as the result.
         """
-        max_len = max(len(self.value), len(other.value))
-        self_padded = self.value.zfill(max_len)
-        other_padded = other.value.zfill(max_len)
-        result = ''.join('1' if self_padded[i] == '1' or other_padded[i] == '1' else '0' for i in range(max_len))
-        return BinaryNumber(result)
+        return BinaryNumber._from_int(self._int | other._int, max(self._len, other._len))
 
     def __xor__(self, other: "BinaryNumber") -> "BinaryNumber":
         """
@@ -62,11 +93,7 @@ class BinaryNumber:
         Returns:
             BinaryNumber: A new BinaryNumber object as the result.
         """
-        max_len = max(len(self.value), len(other.value))
-        self_padded = self.value.zfill(max_len)
-        other_padded = other.value.zfill(max_len)
-        result = ''.join('1' if self_padded[i] != other_padded[i] else '0' for i in range(max_len))
-        return BinaryNumber(result)
+        return BinaryNumber._from_int(self._int ^ other._int, max(self._len, other._len))
 
     def __invert__(self) -> "BinaryNumber":
         """
@@ -75,8 +102,8 @@ class BinaryNumber:
         Returns:
             BinaryNumber: A new BinaryNumber object as the result.
         """
-        result = ''.join('1' if bit == '0' else '0' for bit in self.value)
-        return BinaryNumber(result)
+        mask = (1 << self._len) - 1
+        return BinaryNumber._from_int(self._int ^ mask, self._len)
 
 
 def test_binary_operations():
@@ -5,73 +5,99 @@ class Fraction:
     """
     A class for handling fractions (rational numbers).
 
+    Results of arithmetic operations are kept unsimplified until their
+    numerator, denominator or representation is needed.
+
     Args:
         numerator (int): The numerator of the fraction.
         denominator (int): The denominator of the fraction.
     """
 
+    __slots__ = ('_numerator', '_denominator', '_simplified')
+
     def __init__(self, numerator: int, denominator: int):
         if denominator == 0:
             raise ValueError("Denominator cannot be zero.")
-        self.numerator = numerator
-        self.denominator = denominator
+        self._numerator = numerator
+        self._denominator = denominator
         self.simplify()
 
+    @classmethod
+    def _raw(cls, numerator: int, denominator: int) -> "Fraction":
+        """Creates a fraction with a non-zero denominator, deferring simplification."""
+        obj = cls.__new__(cls)
+        obj._numerator = numerator
+        obj._denominator = denominator
+        obj._simplified = False
+        return obj
+
+    @property
+    def numerator(self) -> int:
+        """The numerator of the simplified fraction."""
+        if not self._simplified:
+            self.simplify()
+        return self._numerator
+
+    @property
+    def denominator(self) -> int:
+        """The denominator of the simplified fraction, always positive."""
+        if not self._simplified:
+            self.simplify()
+        return self._denominator
+
     def simplify(self) -> None:
         """Simplifies a fraction by finding the greatest common divisor (GCD)."""
-        common_divisor = gcd(self.numerator, self.denominator)
-        self.numerator //= common_divisor
-        self.denominator //= common_divisor
-        if self.denominator < 0:
-            self.numerator = -self.numerator
-            self.denominator = -self.denominator
+        common_divisor = gcd(self._numerator, self._denominator)
+        self._numerator //= common_divisor
+        self._denominator //= common_divisor
+        if self._denominator < 0:
+            self._numerator = -self._numerator
+            self._denominator = -self._denominator
+        self._simplified = True
 
     def __add__(self, other: "Fraction") -> "Fraction":
         """Adding two fractions."""
         if not isinstance(other, Fraction):
             return NotImplemented
         new_numerator = (
-                self.numerator * other.denominator + other.numerator * self.denominator
+                self._numerator * other._denominator + other._numerator * self._denominator
         )
-        new_denominator = self.denominator * other.denominator
-        return Fraction(new_numerator, new_denominator)
+        new_denominator = self._denominator * other._denominator
+        return Fraction._raw(new_numerator, new_denominator)
 
     def __sub__(self, other: "Fraction") -> "Fraction":
         """Subtracting two fractions."""
         if not isinstance(other, Fraction):
             return NotImplemented
         new_numerator = (
-                self.numerator * other.denominator - other.numerator * self.denominator
+                self._numerator * other._denominator - other._numerator * self._denominator
         )
-        new_denominator = self.denominator * other.denominator
-        return Fraction(new_numerator, new_denominator)
+        new_denominator = self._denominator * other._denominator
+        return Fraction._raw(new_numerator, new_denominator)
 
     def __mul__(self, other: "Fraction") -> "Fraction":
         """Multiplication of two fractions."""
         if not isinstance(other, Fraction):
             return NotImplemented
-        new_numerator = self.numerator * other.numerator
-        new_denominator = self.denominator * other.denominator
-        return Fraction(new_numerator, new_denominator)
+        new_numerator = self._numerator * other._numerator
+        new_denominator = self._denominator * other._denominator
+        return Fraction._raw(new_numerator, new_denominator)
 
     def __truediv__(self, other: "Fraction") -> "Fraction":
         """Division of two fractions."""
         if not isinstance(other, Fraction):
             return NotImplemented
-        if other.numerator == 0:
+        if other._numerator == 0:
             raise ValueError("Cannot divide by zero.")
-        new_numerator = self.numerator * other.denominator
-        new_denominator = self.denominator * other.numerator
-        return Fraction(new_numerator, new_denominator)
+        new_numerator = self._numerator * other._denominator
+        new_denominator = self._denominator * other._numerator
+        return Fraction._raw(new_numerator, new_denominator)
 
     def __eq__(self, other: "Fraction") -> bool:
-        """Check for equality of fractions."""
+        """Check for equality of fractions by cross-multiplication, without simplifying."""
         if not isinstance(other, Fraction):
             return NotImplemented
-        return (
-                self.numerator == other.numerator
-                and self.denominator == other.denominator
-        )
+        return self._numerator * other._denominator == other._numerator * self._denominator
 
     def __repr__(self) -> str:
         """Correct representation of a fraction in the form 'numerator/denominator'."""
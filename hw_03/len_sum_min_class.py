@@ -1,4 +1,4 @@
-from typing import Generator, Any
+from typing import Iterator, Any
 
 
 class MyList:
@@ -25,15 +25,14 @@ class MyList:
         """
         return len(self.items)
 
-    def __iter__(self) -> Generator[Any, None, None]:
+    def __iter__(self) -> Iterator[Any]:
         """
         Allow iteration over the list elements.
 
-        Yields:
-            Any: Each element in the list.
+        Returns:
+            Iterator[Any]: The iterator of the underlying list.
         """
-        for item in self.items:
-            yield item
+        return iter(self.items)
 
     def my_sum(self) -> Any:
         """
@@ -42,11 +41,11 @@ class MyList:
         Returns:
             Any: The sum of all elements in the list.
         """
-        return sum(self)
+        return sum(self.items)
 
     def my_min(self) -> Any:
         """
-        Find the minimum element in the list using insertion sort.
+        Find the minimum element in the list with a single linear scan.
 
         Returns:
             Any: The smallest element in the list.
@@ -57,17 +56,7 @@ class MyList:
         if not self.items:
             raise ValueError("my_min() list of arguments is empty")
 
-        items_copy = self.items[:]
-        for i in range(1, len(items_copy)):
-            current = items_copy[i]
-            j = i - 1
-            while j >= 0 and items_copy[j] > current:
-                items_copy[j + 1] = items_copy[j]
-                j -= 1
-            items_copy[j + 1] = current
-
-        # Minimum element is the first in the sorted list
-        return items_copy[0]
+        return min(self.items)
 
 
 def test_my_list():
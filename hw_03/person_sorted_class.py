@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import List
 
 
@@ -75,7 +76,10 @@ class Person:
 
 def sort_people(people: List[Person]) -> List[Person]:
     """
-    Sort a list of Person objects by age using insertion sort.
+    Sort a list of Person objects by age in place.
+
+    Uses the built-in Timsort keyed on the age attribute, so the
+    comparisons are done on plain integers instead of Person methods.
 
     Args:
         people (List[Person]): A list of Person objects to be sorted.
@@ -83,15 +87,7 @@ def sort_people(people: List[Person]) -> List[Person]:
     Returns:
         List[Person]: The sorted list of Person objects.
     """
-    for i in range(1, len(people)):
-        current_person = people[i]
-        j = i - 1
-        # Move all elements greater than the current person to one position up
-        while j >= 0 and people[j] > current_person:
-            people[j + 1] = people[j]
-            j -= 1
-        # Insert the current person at the correct position
-        people[j + 1] = current_person
+    people.sort(key=attrgetter('age'))
     return people
 
 
@@ -1,4 +1,6 @@
 class Price:
+    __slots__ = ('amount',)
+
     def __init__(self, amount: float):
         self.amount = round(amount, 2)
 
@@ -3,12 +3,16 @@ class Product(type):
     Metaclass for creating product classes with predefined attributes.
     """
     def __new__(cls, name, bases, dct):
-        dct.setdefault('name', None)
-        dct.setdefault('price', None)
+        slots = dct.get('__slots__', ())
+        for attr in ('name', 'price'):
+            if attr not in slots:  # A slot already defines the attribute, a class default would clash with it
+                dct.setdefault(attr, None)
         return super().__new__(cls, name, bases, dct)
 
 
 class ProductWithGetSet(metaclass=Product):
+    __slots__ = ('name', '_price')  # No per-instance __dict__
+
     def __init__(self, name: str, price: float):
         self.name = name
         self.set_price(price)
@@ -23,6 +27,8 @@ class ProductWithGetSet(metaclass=Product):
 
 
 class ProductWithProperty(metaclass=Product):
+    __slots__ = ('name', '_price')  # No per-instance __dict__
+
     def __init__(self, name: str, price: float):
         self.name = name
         self.price = price
@@ -47,10 +53,16 @@ class PriceDescriptor:
         if value < 0:
             raise ValueError("Price cannot be negative.")
         instance._price = round(value, 2)
+        instance._converted = {}  # Converted prices are stale now
 
 
 class CurrencyDescriptor:
-    """Descriptor for converting price based on currency exchange rates."""
+    """
+    Descriptor for converting price based on currency exchange rates.
+
+    The converted price is cached on the instance together with the rate
+    it was computed for, until the price or the rate changes.
+    """
     def __init__(self, base_currency: str, exchange_rate: float):
         self.base_currency = base_currency
         self.exchange_rate = exchange_rate
@@ -58,11 +70,19 @@ class CurrencyDescriptor:
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        return round(instance.price * self.exchange_rate, 2)
+        rate = self.exchange_rate
+        cached = instance._converted.get(self)
+        if cached is not None and cached[0] == rate:
+            return cached[1]
+        converted = round(instance._price * rate, 2)
+        instance._converted[self] = (rate, converted)
+        return converted
 
 
 class ProductWithDescriptor(metaclass=Product):
     """Product class using descriptors for price and currency conversion."""
+    __slots__ = ('name', '_price', '_converted')
+
     price = PriceDescriptor()
     price_usd = CurrencyDescriptor("USD", 1.0)
     price_eur = CurrencyDescriptor("EUR", 1.0)
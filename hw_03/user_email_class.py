@@ -2,6 +2,10 @@ import re
 
 
 class User:
+    __slots__ = ('_first_name', '_last_name', '_email')
+
+    _EMAIL_RE = re.compile(r'^[\w.-]+@[\w.-]+\.[a-zA-Z]{2,}\Z')
+
     def __init__(self, first_name: str, last_name: str, email: str):
         self._first_name = first_name
         self._last_name = last_name
@@ -40,10 +44,9 @@ class User:
             raise ValueError(f"Invalid email format: {value}")
         self._email = value
 
-    @staticmethod
-    def _is_valid_email(email: str) -> bool:
-        email_regex = r'^[\w.-]+@[\w.-]+\.[a-zA-Z]{2,}$'
-        return re.match(email_regex, email) is not None
+    @classmethod
+    def _is_valid_email(cls, email: str) -> bool:
+        return cls._EMAIL_RE.match(email) is not None
 
     def __repr__(self):
         return f"User(first_name='{self.first_name}', last_name='{self.last_name}', email='{self.email}')"
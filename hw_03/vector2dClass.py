@@ -11,6 +11,8 @@ class Vector:
         y (float): The y-coordinate of the vector.
     """
 
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: float, y: float):
         """
         Initialize a vector with x and y coordinates.
@@ -76,7 +78,7 @@ class Vector:
         """
         if not isinstance(other, Vector):
             return NotImplemented
-        return self.length() < other.length()
+        return self._length_squared() < other._length_squared()
 
     def __eq__(self, other: "Vector") -> bool:
         """
@@ -90,7 +92,19 @@ class Vector:
         """
         if not isinstance(other, Vector):
             return NotImplemented
-        return self.length() == other.length()
+        return self._length_squared() == other._length_squared()
+
+    def _length_squared(self) -> float:
+        """
+        Calculate the squared length of the vector.
+
+        The square root is monotonic, so comparing squared lengths gives
+        the same result as comparing lengths without computing it.
+
+        Returns:
+            float: The squared length of the vector.
+        """
+        return self.x * self.x + self.y * self.y
 
     def length(self) -> float:
         """
@@ -99,7 +113,7 @@ class Vector:
         Returns:
             float: The length of the vector.
         """
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+        return math.sqrt(self._length_squared())
 
     def __repr__(self) -> str:
         """
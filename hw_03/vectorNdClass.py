@@ -1,4 +1,5 @@
-from math import sqrt
+from math import hypot
+from operator import add, mul, sub
 
 
 class Vector:
@@ -6,6 +7,8 @@ class Vector:
     Represents an n-dimensional vector with basic vector operations.
     """
 
+    __slots__ = ('components',)
+
     def __init__(self, *components: float):
         """
         Initializes a vector with n dimensions.
@@ -30,7 +33,7 @@ class Vector:
         """
         if len(self.components) != len(other.components):
             raise ValueError("Vectors must have the same dimension for addition.")
-        return Vector(*(self.components[i] + other.components[i] for i in range(len(self.components))))
+        return Vector(*map(add, self.components, other.components))
 
     def __sub__(self, other: "Vector") -> "Vector":
         """
@@ -47,7 +50,7 @@ class Vector:
         """
         if len(self.components) != len(other.components):
             raise ValueError("Vectors must have the same dimension for subtraction.")
-        return Vector(*(self.components[i] - other.components[i] for i in range(len(self.components))))
+        return Vector(*map(sub, self.components, other.components))
 
     def __mul__(self, other: "Vector") -> float:
         """
@@ -64,7 +67,7 @@ class Vector:
         """
         if len(self.components) != len(other.components):
             raise ValueError("Vectors must have the same dimension for scalar multiplication.")
-        return sum(self.components[i] * other.components[i] for i in range(len(self.components)))
+        return sum(map(mul, self.components, other.components))
 
     def length(self) -> float:
         """
@@ -73,7 +76,7 @@ class Vector:
         Returns:
             float: The length of the vector.
         """
-        return sqrt(sum(x**2 for x in self.components))
+        return hypot(*self.components)
 
     def __lt__(self, other: "Vector") -> bool:
         """
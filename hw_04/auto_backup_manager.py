@@ -1,9 +1,18 @@
 import os
 import shutil
+import sys
 from typing import List, Optional
 from datetime import datetime
 import getpass
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# ioctl request for a copy-on-write clone of a whole file (Linux, Btrfs/XFS)
+FICLONE = 0x40049409
+
 
 def get_file_from_directory() -> str:
     """
@@ -20,7 +29,9 @@ def get_file_from_directory() -> str:
         print("Error: Invalid directory path.")
         exit()
 
-    processing_files = [f for f in os.listdir(processing_path)]
+    # DirEntry.is_file() uses the file type returned with the listing, no extra stat per entry
+    with os.scandir(processing_path) as entries:
+        processing_files = [entry.name for entry in entries if entry.is_file()]
 
     if not processing_files:
         print("Error: No files found in the selected directory.")
@@ -41,6 +52,28 @@ def get_file_from_directory() -> str:
     return os.path.join(processing_path, processing_files[file_index])
 
 
+def fast_copy(src: str, dst: str) -> None:
+    """
+    Copies the file contents without metadata.
+
+    On file systems that support it, the copy is a reflink that shares the data
+    blocks and takes constant time. Otherwise shutil.copyfile is used, which
+    copies in the kernel where the platform allows it.
+
+    Args:
+        src (str): Path to the source file.
+        dst (str): Path to the destination file.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+            return
+        except OSError:
+            pass  # No reflink support, fall back to a regular copy
+    shutil.copyfile(src, dst)
+
+
 class FileBackupManager:
     """
     Context manager that creates a backup of an important file before processing it.
@@ -63,8 +96,16 @@ class FileBackupManager:
             str: Path to the temporary file for processing.
         """
         if os.path.exists(self.file_path):
-            shutil.copy2(self.file_path, self.backup_path)  # Backup with timestamped name
-        shutil.copy2(self.file_path, self.temp_path)
+            # Backup with timestamped name. A hard link costs no copying: the original
+            # is never changed in place, it is only replaced by renaming the temp file
+            try:
+                os.link(self.file_path, self.backup_path)
+            except OSError:  # No hard links on this file system
+                shutil.copy2(self.file_path, self.backup_path)
+        # The working copy needs no timestamps, only the permission bits
+        # that it passes on to the original file when it replaces it
+        fast_copy(self.file_path, self.temp_path)
+        shutil.copymode(self.file_path, self.temp_path)
         return self.temp_path
 
     def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[object]) -> None:
@@ -98,11 +139,11 @@ def modification_file(file_path: str) -> None:
     user_name = getpass.getuser()  # Get the current username
 
     with FileBackupManager(file_path) as temp_file:
-        with open(temp_file, "r", encoding="utf-8") as t_f:
-            some_data = t_f.read()
-
         print("Current file data:")
-        print(some_data)
+        # Stream the file in 1 MiB chunks instead of reading it into memory at once
+        with open(temp_file, "r", encoding="utf-8") as t_f:
+            shutil.copyfileobj(t_f, sys.stdout, 1 << 20)
+        print()
 
         new_data = input("Enter new information (if you want to change file): ").strip()
         if not new_data:
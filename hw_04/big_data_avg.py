@@ -1,8 +1,12 @@
+import csv
 import os
 import sys
+from functools import lru_cache
 from typing import Generator, Optional
 from datetime import datetime
 
+WRITE_BATCH = 4096  # Result lines written per writelines() call
+
 
 def get_file_for_avg() -> tuple[str, str]:
     """
@@ -18,8 +22,9 @@ def get_file_for_avg() -> tuple[str, str]:
         print("Error: Invalid directory path.")
         input_dir = input("Enter a valid folder path: ").strip()
 
-    available_files = [f for f in os.listdir(input_dir) if
-                       os.path.isfile(os.path.join(input_dir, f))]
+    # DirEntry.is_file() uses the file type returned with the listing, no extra stat per entry
+    with os.scandir(input_dir) as entries:
+        available_files = [entry.name for entry in entries if entry.is_file()]
 
     if not available_files:
         print("Error: No files found in the selected directory.")
@@ -50,6 +55,29 @@ def get_file_for_avg() -> tuple[str, str]:
     return input_file_path, output_dir
 
 
+@lru_cache(maxsize=4096)
+def date_sort_key(date_field: bytes, date_format: str) -> Optional[bytes]:
+    """
+    Converts a date field into a 'YYYYMMDD' key.
+
+    The keys compare as byte strings in the same order as the dates, so range
+    checks need no datetime objects. The same dates repeat on many lines,
+    so the results are cached and each distinct date is parsed only once.
+
+    Args:
+        date_field (bytes): The date field of a line of the stock file.
+        date_format (str): The format of the date, as for datetime.strptime.
+
+    Returns:
+        Optional[bytes]: The date key, or None if the field is not a valid date.
+    """
+    try:
+        date = datetime.strptime(date_field.decode("ascii"), date_format)
+    except (UnicodeDecodeError, ValueError):
+        return None
+    return date.strftime("%Y%m%d").encode("ascii")
+
+
 class StockAverageCalculator:
     """
     Context manager for calculating average stock values in a given date range from a large file.
@@ -71,27 +99,36 @@ class StockAverageCalculator:
         """
         self._analyze_file()
         self._get_user_date_range()
-        self.output_file = open(self.output_path, "w", encoding="utf-8")
+        self.output_file = open(self.output_path, "w", encoding="utf-8", buffering=1 << 20)
         self.output_file.write("Date,Average_Stock\n")  # CSV header
         return self
 
     def _analyze_file(self) -> None:
         """
         Reads the file to find the minimum and maximum dates.
+
+        Dates are compared as 'YYYYMMDD' keys, which order the same way
+        as the dates, so datetime objects are built only for the two extreme dates.
         """
-        with open(self.file_path, "r", encoding="utf-8") as file:
+        min_key: Optional[bytes] = None
+        max_key: Optional[bytes] = None
+
+        with open(self.file_path, "rb") as file:
             for line in file:
-                try:
-                    date_str, _ = line.strip().split(";", 1)
-                    date_obj = datetime.strptime(date_str, self.date_format)
-
-                    if self.min_date is None or date_obj < self.min_date:
-                        self.min_date = date_obj
-                    if self.max_date is None or date_obj > self.max_date:
-                        self.max_date = date_obj
-                except ValueError:
+                date_field, separator, _ = line.partition(b";")
+                date_key = date_sort_key(date_field.strip(), self.date_format) if separator else None
+                if date_key is None:
                     continue  # Skip invalid lines
 
+                if min_key is None or date_key < min_key:
+                    min_key = date_key
+                if max_key is None or date_key > max_key:
+                    max_key = date_key
+
+        if min_key is not None:  # Only valid dates have keys
+            self.min_date = datetime.strptime(min_key.decode("ascii"), "%Y%m%d")
+            self.max_date = datetime.strptime(max_key.decode("ascii"), "%Y%m%d")
+
         if self.min_date is None or self.max_date is None:
             print("Error: No valid date records found in the file.")
             sys.exit(1)
@@ -129,30 +166,39 @@ class StockAverageCalculator:
         """
         Reads the file line by line and calculates the running average for the given date range.
 
+        The file is read in binary mode and the date is checked on the raw bytes,
+        so lines outside the range are never decoded. Lines in the range are split
+        on ';' directly, and only lines with quoted fields go through the csv parser.
+
         Yields:
             tuple[str, float]: The date and corresponding average stock value.
         """
         total_sum = 0.0
         total_count = 0
+        start_key = self.start_date.strftime("%Y%m%d").encode("ascii")
+        end_key = self.end_date.strftime("%Y%m%d").encode("ascii")
 
-        with open(self.file_path, "r", encoding="utf-8") as file:
-            first_line = file.readline().strip()
-            if "Кіл-ть" not in first_line:
+        with open(self.file_path, "rb") as file:
+            header_line = file.readline().decode("utf-8").rstrip("\r\n")
+            header = next(csv.reader([header_line], delimiter=";"), [])
+            if "Кіл-ть" not in header:
                 print('Column "Кіл-ть" not found in the header!')
                 sys.exit(1)
 
-            header = first_line.split(';')
             quantity_index = header.index("Кіл-ть")
 
             for line in file:
                 try:
-                    row = line.strip().split(';')
-                    date_str = row[0]
-                    stock_value = row[quantity_index]
-                    date_obj = datetime.strptime(date_str, self.date_format)
-
-                    if self.start_date <= date_obj <= self.end_date:
-                        stock_value = float(stock_value)
+                    date_field = line.partition(b";")[0].strip()
+                    date_key = date_sort_key(date_field, self.date_format)
+
+                    if date_key is not None and start_key <= date_key <= end_key:
+                        if b'"' in line:
+                            row = next(csv.reader([line.decode("utf-8")], delimiter=";"))
+                        else:
+                            row = line.split(b";")
+                        stock_value = float(row[quantity_index])  # float() accepts bytes
+                        date_str = date_field.decode("ascii")
                         total_sum += stock_value
                         total_count += 1
                         avg_stock = total_sum / total_count
@@ -176,6 +222,13 @@ if __name__ == "__main__":
     output_file_path = os.path.join(output_dir, output_file_name)
 
     with StockAverageCalculator(input_file, output_file_path) as stock_calc:
+        verbose = "--verbose" in sys.argv[1:]
+        batch = []
         for date, avg in stock_calc.calculate_average():
-            print(f"{date}: {avg:.2f}")
-            stock_calc.output_file.write(f"{date},{avg:.2f}\n")
+            batch.append(f"{date},{avg:.2f}\n")
+            if verbose:
+                print(f"{date}: {avg:.2f}")
+            if len(batch) >= WRITE_BATCH:
+                stock_calc.output_file.writelines(batch)
+                batch.clear()
+        stock_calc.output_file.writelines(batch)
@@ -1,3 +1,4 @@
+import os
 from typing import Iterator
 
 
@@ -6,16 +7,18 @@ class BinaryFileReader:
     Context manager for reading binary files in large blocks.
     """
 
-    def __init__(self, file_path: str, block_size: int = 1024) -> None:
+    def __init__(self, file_path: str, block_size: int = 1 << 20, verbose: bool = False) -> None:
         """
         Initializes the BinaryFileReader.
 
         Args:
             file_path (str): Path to the binary file.
-            block_size (int): Number of bytes to read at a time. Defaults to 1024.
+            block_size (int): Number of bytes to read at a time. Defaults to 1 MiB.
+            verbose (bool): Print the progress after every block. Defaults to False.
         """
         self.file_path: str = file_path
         self.block_size: int = block_size
+        self.verbose: bool = verbose
         self.file = None
 
     def __enter__(self) -> "BinaryFileReader":
@@ -26,6 +29,9 @@ class BinaryFileReader:
             BinaryFileReader: The context manager instance.
         """
         self.file = open(self.file_path, "rb")
+        if hasattr(os, "posix_fadvise"):
+            # Hint the kernel to read ahead, the file is read from start to end
+            os.posix_fadvise(self.file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
         return self
 
     def read_blocks(self) -> Iterator[bytes]:
@@ -36,12 +42,14 @@ class BinaryFileReader:
             bytes: A block of file data.
         """
         total_bytes_read = 0
+        read, block_size = self.file.read, self.block_size
         while True:
-            block = self.file.read(self.block_size)
+            block = read(block_size)
             if not block:
                 break
-            total_bytes_read += len(block)
-            print(f"Read {len(block)} bytes (Total: {total_bytes_read} bytes)")
+            if self.verbose:
+                total_bytes_read += len(block)
+                print(f"Read {len(block)} bytes (Total: {total_bytes_read} bytes)")
             yield block
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
@@ -57,6 +65,6 @@ class BinaryFileReader:
 if __name__ == "__main__":
     file_path = "some.txt"  # Change to a valid binary file path
 
-    with BinaryFileReader(file_path) as reader:
+    with BinaryFileReader(file_path, verbose=True) as reader:
         for block in reader.read_blocks():
             pass  # Process block if needed
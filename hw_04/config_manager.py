@@ -1,9 +1,19 @@
+import io
 import json
+import marshal
+import os
+import shutil
 import configparser
-from ipdb import launch_ipdb_on_exception
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
 from datetime import datetime
 from typing import Union, Optional
 
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
 
 def datetime_serializer(obj: datetime) -> str:
     """Serialize datetime objects to ISO format."""
@@ -12,9 +22,50 @@ def datetime_serializer(obj: datetime) -> str:
     raise TypeError(f"Type {type(obj)} is not serializable")
 
 
+def debug_on_exception() -> AbstractContextManager:
+    """
+    Return ipdb's post-mortem context if the CONFIG_DEBUG environment variable is set.
+
+    ipdb (and IPython with it) is imported only in that case, so a normal
+    run does not pay for loading the debugger.
+    """
+    if os.environ.get("CONFIG_DEBUG"):
+        from ipdb import launch_ipdb_on_exception
+        return launch_ipdb_on_exception()
+    return nullcontext()
+
+
+@lru_cache(maxsize=32)
+def _load_json(file_name: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Parse a JSON file and return the result as a marshal snapshot.
+
+    The modification time and size are part of the cache key, so a changed
+    file is parsed again. Every caller unpacks its own copy of the snapshot,
+    which is faster than parsing the JSON again or deep-copying the result.
+
+    Args:
+        file_name (str): Path to the JSON file.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        bytes: The parsed configuration serialized with marshal.
+    """
+    if orjson is not None:
+        with open(file_name, 'rb') as f:
+            return marshal.dumps(orjson.loads(f.read()))
+    with open(file_name, 'r', encoding='utf-8') as f:
+        return marshal.dumps(json.load(f))
+
+
 class ConfigManager:
     """
     Context manager for reading and writing configuration files in JSON or INI format.
+
+    The file is rewritten on exit only if the configuration was modified.
+    update_person_phone marks the changes it makes; code that edits config
+    directly calls mark_modified().
     """
 
     def __init__(self, file_name: str, file_type: str = 'json') -> None:
@@ -28,19 +79,27 @@ class ConfigManager:
         self.file_name = file_name
         self.file_type = file_type
         self.config = None
+        self.modified = False
+        self.name_index: Optional[dict] = None  # Person name -> entry, built on first lookup
+
+    def mark_modified(self) -> None:
+        """Mark the configuration as changed, so it is saved on exit."""
+        self.modified = True
 
     def __enter__(self) -> "ConfigManager":
         """Load the configuration file."""
-        with launch_ipdb_on_exception():
+        with debug_on_exception():
             try:
                 if self.file_type == 'json':
-                    with open(self.file_name, 'r', encoding='utf-8') as f:
-                        self.config = json.load(f)
+                    stat_result = os.stat(self.file_name)
+                    self.config = marshal.loads(
+                        _load_json(self.file_name, stat_result.st_mtime_ns, stat_result.st_size))
                 elif self.file_type == 'ini':
                     self.config = configparser.ConfigParser()
                     self.config.read(self.file_name, encoding='utf-8')
                 else:
                     raise ValueError("Unsupported file format. Use 'json' or 'ini'.")
+                self.name_index = None
                 return self
             except Exception as e:
                 print(f"Error opening file {self.file_name}: {e}")
@@ -48,8 +107,8 @@ class ConfigManager:
 
     def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[object]) -> None:
         """Save the configuration file."""
-        with launch_ipdb_on_exception():
-            if exc_type is None:  # No exception occurred
+        with debug_on_exception():
+            if exc_type is None and self.modified:  # No exception occurred, and there is something to save
                 try:
                     # Add last_modified metadata
                     if isinstance(self.config, dict):
@@ -59,20 +118,55 @@ class ConfigManager:
                             self.config.add_section('Metadata')
                         self.config.set('Metadata', 'last_modified', datetime.now().isoformat())
 
-                    # Save the configuration to the file
-                    with open(self.file_name, 'w', encoding='utf-8') as f_n:
-                        if self.file_type == 'json':
-                            json.dump(self.config, f_n, indent=4, default=datetime_serializer, ensure_ascii=False)
-                        elif self.file_type == 'ini':
-                            self.config.write(f_n, encoding='utf-8')
+                    # Serialize in memory, then save the configuration to the file in one write
+                    if self.file_type == 'json':
+                        data = json.dumps(self.config, indent=4, default=datetime_serializer, ensure_ascii=False)
+                    else:
+                        buffer = io.StringIO()
+                        self.config.write(buffer)
+                        data = buffer.getvalue()
+                    # Write a temp file and rename it over the original, so a crash
+                    # never leaves a partly written configuration behind
+                    temp_name = f"{self.file_name}.tmp"
+                    with open(temp_name, 'wb') as f_n:
+                        f_n.write(data.encode('utf-8'))
+                        f_n.flush()
+                        os.fsync(f_n.fileno())
+                    if os.path.exists(self.file_name):
+                        shutil.copymode(self.file_name, temp_name)
+                    os.replace(temp_name, self.file_name)
+                    self.modified = False
                 except Exception as e:
                     print(f"Error saving file {self.file_name}: {e}")
                     raise
 
+    def _person_index(self) -> dict:
+        """
+        Returns the index of people by name, building it on first use.
+
+        For JSON the values are the person dicts, for INI the section names.
+        If a name occurs more than once, the first entry is indexed.
+
+        Returns:
+            dict: The mapping from a person's name to their entry.
+        """
+        if self.name_index is None:
+            self.name_index = {}
+            if self.file_type == 'json':
+                for person in self.config["people"]:
+                    self.name_index.setdefault(person.get("name"), person)
+            else:
+                for section in self.config.sections():
+                    if self.config.has_option(section, "name"):
+                        self.name_index.setdefault(self.config.get(section, "name"), section)
+        return self.name_index
+
     def update_person_phone(self, person_name: str, new_phone: str) -> None:
         """
         Updates a person's phone number, saving the old number with the change date.
 
+        The person is found through a name index built once per loaded configuration.
+
         Args:
             person_name (str): The name of the person whose phone needs updating.
             new_phone (str): The new phone number to set.
@@ -81,33 +175,32 @@ class ConfigManager:
             ValueError: If the person's name is not found in the data.
         """
         print("Config content:", self.config)  # Print the loaded config to debug
+        changed_at = datetime_serializer(datetime.now())  # One timestamp for the whole update
         if self.file_type == 'json':
             if isinstance(self.config, dict) and "people" in self.config:
-                for person in self.config["people"]:
-                    print(f"Checking person: {person['name']}")  # Debug: check the name
-                    if person.get("name") == person_name:
-                        old_phone = person.get("phone")
-                        if old_phone:
-                            person["old_phone"] = {
-                                "number": old_phone,
-                                "changed_at": datetime_serializer(datetime.now())
-                            }
-                        person["phone"] = new_phone
-                        return
-                raise ValueError(f"Person with name {person_name} not found.")
+                person = self._person_index().get(person_name)
+                if person is None:
+                    raise ValueError(f"Person with name {person_name} not found.")
+                old_phone = person.get("phone")
+                if old_phone:
+                    person["old_phone"] = {
+                        "number": old_phone,
+                        "changed_at": changed_at
+                    }
+                person["phone"] = new_phone
+                self.modified = True
         elif self.file_type == 'ini':
-            for section in self.config.sections():
-                if self.config.has_option(section, "name") and self.config.get(section, "name") == person_name:
-                    old_phone = self.config.get(section, "phone", fallback=None)
-                    if old_phone:
-                        self.config.set(section, "old_phone", f"{old_phone};{datetime_serializer(datetime.now())}")
-                    self.config.set(section, "phone", new_phone)
-                    return
-            raise ValueError(f"Person with name {person_name} not found.")
+            section = self._person_index().get(person_name)
+            if section is None:
+                raise ValueError(f"Person with name {person_name} not found.")
+            old_phone = self.config.get(section, "phone", fallback=None)
+            if old_phone:
+                self.config.set(section, "old_phone", f"{old_phone};{changed_at}")
+            self.config.set(section, "phone", new_phone)
+            self.modified = True
         else:
             raise ValueError("Unsupported file type. Use 'json' or 'ini'.")
 
-
 config_file = "some.json"
 try:
     with ConfigManager(config_file, file_type="json") as manager:
@@ -1,8 +1,32 @@
 import os
-from typing import Iterator
+from typing import Iterator, NamedTuple, Optional
 from datetime import datetime
 
 
+class FileInfo(NamedTuple):
+    """
+    Information about an entry in the directory.
+
+    Entries that are not files, or files that cannot be accessed, have no size
+    and modification time. The modification date is formatted only when the
+    record is converted to a string.
+    """
+
+    name: str
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+    is_file: bool = True
+    error: Optional[str] = None  # Why the file could not be accessed
+
+    def __str__(self) -> str:
+        if self.error is not None:
+            return f"Error accessing file '{self.name}': {self.error}"
+        if not self.is_file:
+            return f"Name: {self.name} (Not a file)"
+        last_modified_date = datetime.fromtimestamp(self.mtime).isoformat()
+        return f"Name: {self.name}, Size: {self.size} bytes, Last modified: {last_modified_date}"
+
+
 class DirectoryFilesIterator:
     """
     Iterator for iterating over files in a given directory.
@@ -18,51 +42,59 @@ class DirectoryFilesIterator:
         Raises:
             ValueError: If the provided path is not a valid directory.
         """
-        if not os.path.isdir(directory_path):
-            raise ValueError(f"The path '{directory_path}' is not a valid directory.")
+        try:
+            self.entries = os.scandir(directory_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError(f"The path '{directory_path}' is not a valid directory.") from None
 
         self.directory_path: str = directory_path
-        self.files: list[str] = os.listdir(directory_path)
-        self.index: int = 0
 
-    def __iter__(self) -> Iterator[str]:
+    def __iter__(self) -> Iterator[FileInfo]:
         """
         Returns the iterator object.
 
         Returns:
-            Iterator[str]: The iterator itself.
+            Iterator[FileInfo]: The iterator itself.
         """
         return self
 
-    def __next__(self) -> str:
+    def __next__(self) -> FileInfo:
         """
         Returns the next file's information (name, size, and last modified date).
 
+        The directory entries cache the file type, and one stat() call
+        gives both the size and the modification time.
+
         Returns:
-            str: A string containing the file's name, size, and last modified date.
+            FileInfo: The entry's record; entries that are not files or
+            cannot be accessed are marked in the record.
 
         Raises:
             StopIteration: If there are no more files to iterate over.
         """
-        while self.index < len(self.files):
-            file_name = self.files[self.index]
-            file_path = os.path.join(self.directory_path, file_name)
-            self.index += 1
-
-            if os.path.isfile(file_path):  # Check if it's a file
-                try:
-                    file_size = os.path.getsize(file_path)
-                    last_modified_time = os.path.getmtime(file_path)
-                    last_modified_date = datetime.fromtimestamp(last_modified_time).isoformat()
-
-                    # Prepare the string with file info
-                    return f"Name: {file_name}, Size: {file_size} bytes, Last modified: {last_modified_date}"
-                except (FileNotFoundError, PermissionError) as e:
-                    return f"Error accessing file '{file_name}': {e}"
-            else:
-                return f"Name: {file_name} (Not a file)"
-
-        raise StopIteration
+        try:
+            entry = next(self.entries)
+        except StopIteration:
+            self.close()
+            raise
+
+        file_name = entry.name
+        if entry.is_file():  # Check if it's a file
+            try:
+                stat_result = entry.stat()
+                return FileInfo(file_name, stat_result.st_size, stat_result.st_mtime)
+            except (FileNotFoundError, PermissionError) as e:
+                return FileInfo(file_name, error=str(e))
+        return FileInfo(file_name, is_file=False)
+
+    def close(self) -> None:
+        """Closes the underlying directory scan."""
+        self.entries.close()
+
+    def __del__(self) -> None:
+        """Releases the directory scan when the iterator is garbage collected."""
+        if hasattr(self, 'entries'):
+            self.close()
 
 
 def get_directory_from_user() -> str:
@@ -20,6 +20,8 @@ class EvenNumberSaver:
     Context manager that writes a limited number of even numbers to a file.
     """
 
+    CHUNK_SIZE: int = 1 << 16  # Numbers formatted and written per write() call
+
     def __init__(self, file_name: str, limit: int = 100) -> None:
         """
         Initializes the context manager.
@@ -34,11 +36,14 @@ class EvenNumberSaver:
     def __enter__(self) -> None:
         """
         Enters the context and writes even numbers to the file.
+
+        The numbers come from a range, converted and joined in C one chunk at a time.
         """
-        with open(self.file_name, 'w', encoding='utf-8') as file:
-            generator = even_number_generator()
-            for _ in range(self.limit):
-                file.write(f"{next(generator)}\n")
+        stop = 2 * self.limit + 2
+        step = 2 * self.CHUNK_SIZE
+        with open(self.file_name, 'w', encoding='utf-8', buffering=1 << 20) as file:
+            for start in range(2, stop, step):
+                file.write("\n".join(map(str, range(start, min(start + step, stop), 2))) + "\n")
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         """
@@ -1,8 +1,132 @@
 import os
 import csv
-from typing import Iterator
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import BinaryIO, Iterator, Optional
 from PIL import Image
 
+# PNG (color type, bit depth) -> image mode, as reported by PIL
+PNG_MODES: dict[tuple[int, int], str] = {
+    (0, 1): '1', (0, 2): 'L', (0, 4): 'L', (0, 8): 'L',
+    (2, 8): 'RGB', (2, 16): 'RGB',
+    (3, 1): 'P', (3, 2): 'P', (3, 4): 'P', (3, 8): 'P',
+    (4, 8): 'LA', (4, 16): 'LA',
+    (6, 8): 'RGBA', (6, 16): 'RGBA',
+}
+# JPEG number of color components -> image mode
+JPEG_MODES: dict[int, str] = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+# JPEG start-of-frame markers, which hold the image size
+JPEG_SOF_MARKERS = frozenset((0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+                              0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF))
+
+
+def read_jpeg_frame(file: BinaryIO) -> Optional[tuple[int, int, str, str]]:
+    """
+    Walks the JPEG segments after the SOI marker up to the start-of-frame segment.
+
+    A multi-picture file (MPO, as written by many cameras) carries an APP2 'MPF'
+    segment; PIL reports such files as 'MPO', so they are left to PIL.
+
+    Args:
+        file (BinaryIO): The image file positioned right after the SOI marker.
+
+    Returns:
+        Optional[tuple[int, int, str, str]]: Width, height, format and mode,
+        or None if the frame header is not found or not supported, or the file is an MPO.
+    """
+    while True:
+        marker = file.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code == 0xFF:  # Fill byte, the marker code follows
+            file.seek(-1, os.SEEK_CUR)
+            continue
+        if code == 0x01 or 0xD0 <= code <= 0xD8:
+            continue  # Markers without a segment
+        length_bytes = file.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = int.from_bytes(length_bytes, 'big')
+        if code in JPEG_SOF_MARKERS:
+            frame = file.read(6)
+            if len(frame) < 6:
+                return None
+            _, height, width, components = struct.unpack('>BHHB', frame)
+            mode = JPEG_MODES.get(components)
+            return (width, height, 'JPEG', mode) if mode else None
+        if code == 0xDA:  # Image data starts without a frame header
+            return None
+        if code == 0xE2 and length >= 6:  # APP2, holds the multi-picture index of an MPO file
+            if file.read(4) == b'MPF\x00':
+                return None
+            file.seek(length - 6, os.SEEK_CUR)
+            continue
+        file.seek(length - 2, os.SEEK_CUR)
+
+
+def read_image_header(file_path: str) -> Optional[tuple[int, int, str, str]]:
+    """
+    Reads the size, format and mode of a PNG or JPEG image from its header.
+
+    Only a few header bytes are read, without creating a PIL image.
+
+    Args:
+        file_path (str): The path to the image file.
+
+    Returns:
+        Optional[tuple[int, int, str, str]]: Width, height, format and mode,
+        or None if the file is not a PNG or JPEG image this function can read.
+    """
+    with open(file_path, 'rb') as file:
+        head = file.read(26)
+        if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+            width, height, bit_depth, color_type = struct.unpack('>IIBB', head[16:26])
+            mode = PNG_MODES.get((color_type, bit_depth))
+            return (width, height, 'PNG', mode) if mode else None
+        if head[:2] == b'\xff\xd8':
+            file.seek(2)
+            return read_jpeg_frame(file)
+    return None
+
+
+def get_image_metadata(file_path: str) -> Optional[dict]:
+    """
+    Reads the metadata of an image file.
+
+    Args:
+        file_path (str): The path to the image file.
+
+    Returns:
+        Optional[dict]: A dictionary contains the file's name, width, height, format, and mode,
+        or None if the image cannot be read.
+    """
+    file_name = os.path.basename(file_path)
+    try:
+        header = read_image_header(file_path)
+        if header is not None:
+            width, height, image_format, mode = header
+            return {
+                'filename': file_name,
+                'width': width,
+                'height': height,
+                'format': image_format,
+                'mode': mode
+            }
+        # Other formats are read by PIL
+        with Image.open(file_path) as image:  # Using 'with' to automatically close the image
+            return {
+                'filename': file_name,
+                'width': image.width,
+                'height': image.height,
+                'format': image.format,
+                'mode': image.mode
+            }
+    except Exception as e:
+        print(f"Error processing image '{file_name}': {e}")
+        return None
+
 
 class FolderImgIterator:
     """
@@ -26,9 +150,8 @@ class FolderImgIterator:
             raise ValueError(f"The path '{folder_path}' is not a valid directory.")
 
         self.folderPath: str = folder_path
-        self.file_ext: list[str] = [ext.strip().lower() for ext in file_ext]
-        self.files: list[str] = os.listdir(folder_path)
-        self.index: int = 0
+        self.file_ext: tuple[str, ...] = tuple(ext.strip().lower() for ext in file_ext)
+        self.entries = os.scandir(folder_path)
 
     def __iter__(self) -> Iterator[dict]:
         """
@@ -49,27 +172,34 @@ class FolderImgIterator:
         Raises:
             StopIteration: If there are no more files to iterate.
         """
-        while self.index < len(self.files):
-            file_name = self.files[self.index]
-            file_path = os.path.join(self.folderPath, file_name)
-            self.index += 1
-
-            if os.path.isfile(file_path) and any(file_name.lower().endswith(ext) for ext in self.file_ext):
-                try:
-                    with Image.open(file_path) as image:  # Using 'with' to automatically close the image
-                        metadata = {
-                            'filename': file_name,
-                            'width': image.width,
-                            'height': image.height,
-                            'format': image.format,
-                            'mode': image.mode
-                        }
-                        return metadata
-                except Exception as e:
-                    print(f"Error processing image '{file_name}': {e}")
-                    continue
+        for file_path in self.image_paths():
+            metadata = get_image_metadata(file_path)
+            if metadata is not None:
+                return metadata
+        self.close()
         raise StopIteration
 
+    def image_paths(self) -> Iterator[str]:
+        """
+        Yields the paths of the remaining files with the requested extensions.
+
+        Yields:
+            str: The path to an image file.
+        """
+        for entry in self.entries:
+            # The directory entry caches the file type, so no stat() call is needed
+            if entry.name.lower().endswith(self.file_ext) and entry.is_file():
+                yield entry.path
+
+    def close(self) -> None:
+        """Closes the underlying directory scan."""
+        self.entries.close()
+
+    def __del__(self) -> None:
+        """Releases the directory scan when the iterator is garbage collected."""
+        if hasattr(self, 'entries'):
+            self.close()
+
 
 def get_directory_from_user() -> str:
     """
@@ -95,16 +225,21 @@ def save_metadata_to_csv(folder_path: str, output_csv: str, file_ext: list[str])
     iterator = FolderImgIterator(folder_path, file_ext)
 
     # Open the CSV file for writing
-    with open(output_csv, mode='w', newline='', encoding='utf-8') as csvfile:
+    with open(output_csv, mode='w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
         fieldnames: list[str] = ['filename', 'width', 'height', 'format', 'mode']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.writer(csvfile)
 
         # Write header
-        writer.writeheader()
+        writer.writerow(fieldnames)
 
-        # Write image metadata to CSV
-        for img_metadata in iterator:
-            writer.writerow(img_metadata)
+        # Image headers are read in worker threads, so the reads of many files overlap;
+        # map() returns the results in the order of the files
+        row = itemgetter(*fieldnames)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            for img_metadata in executor.map(get_image_metadata, iterator.image_paths()):
+                if img_metadata is not None:
+                    writer.writerow(row(img_metadata))
+        iterator.close()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,16 @@
+import codecs
 import os
 import re
-from typing import Iterator, List
+from typing import Callable, Iterator, List, Optional
+
+from mapped_lines_utils import encode_matched_lines, matched_lines_mapped, write_lines
+
+try:
+    import ahocorasick  # Optional: scans for many literal keywords in one pass
+except ImportError:
+    ahocorasick = None
+
+REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
 
 
 class KeywordLineFilter:
@@ -9,7 +19,8 @@ class KeywordLineFilter:
     while also providing the line number.
     """
 
-    def __init__(self, file_name: str, keyword: str, encoding: str = 'utf-8') -> None:
+    def __init__(self, file_name: str, keyword: str, encoding: str = 'utf-8',
+                 keywords: Optional[List[str]] = None) -> None:
         """
         Initializes the generator.
 
@@ -17,10 +28,48 @@ class KeywordLineFilter:
             file_name (str): The path to the file.
             keyword (str): The keyword to filter lines.
             encoding (str): The file encoding. Defaults to 'utf-8'.
+            keywords (Optional[List[str]]): More keywords; a line is kept if it contains any of them.
         """
         self.file_name: str = file_name
         self.keyword: str = keyword
         self.encoding: str = encoding
+        self.keywords: List[str] = [keyword, *(keywords or [])]
+        # Keywords without regex syntax are matched as plain substrings,
+        # anything else is compiled once for all lines
+        self.is_literal: bool = all(REGEX_METACHARS.isdisjoint(word) for word in self.keywords)
+        self.needles: List[str] = [word.lower() for word in self.keywords]
+        self.pattern: re.Pattern = re.compile("|".join(f"(?:{word})" for word in self.keywords), re.IGNORECASE)
+        # Non-empty ASCII keywords in a UTF-8 file can be searched in the raw bytes
+        self.bytes_pattern: Optional[re.Pattern] = None
+        if (self.is_literal and all(word and word.isascii() for word in self.keywords)
+                and codecs.lookup(encoding).name == 'utf-8'):
+            self.bytes_pattern = re.compile(
+                b"|".join(re.escape(word.encode()) for word in self.keywords), re.IGNORECASE)
+
+    def _line_matcher(self) -> Callable[[str], bool]:
+        """
+        Chooses the cheapest check for the keywords.
+
+        Returns:
+            Callable[[str], bool]: A function telling whether a line contains any keyword.
+        """
+        if not self.is_literal:
+            search = self.pattern.search
+            return lambda line: search(line) is not None
+
+        if len(self.needles) == 1:
+            needle = self.needles[0]
+            return lambda line: needle in line.lower()
+
+        if ahocorasick is not None and all(self.needles):
+            automaton = ahocorasick.Automaton()
+            for needle in self.needles:
+                automaton.add_word(needle, needle)
+            automaton.make_automaton()
+            return lambda line: next(automaton.iter(line.lower()), None) is not None
+
+        needles = self.needles
+        return lambda line: any(needle in line.lower() for needle in needles)
 
     def __iter__(self) -> Iterator[str]:
         """
@@ -29,13 +78,37 @@ class KeywordLineFilter:
         Yields:
             str: The filtered lines containing the keyword with line numbers.
         """
+        if self.bytes_pattern is not None:
+            for line_number, line in matched_lines_mapped(self.file_name, self.bytes_pattern):
+                yield f"Line {line_number}: {line.decode(self.encoding, errors='replace').strip()}"
+            return
+
+        matches = self._line_matcher()
         with open(self.file_name, 'r', encoding=self.encoding, errors='replace') as file:
             for line_number, line in enumerate(file, start=1):  # Start line numbering from 1
-                if re.search(self.keyword, line, re.IGNORECASE):
+                if matches(line):
                     yield f"Line {line_number}: {line.strip()}"
 
+    def iter_encoded(self) -> Iterator[bytes]:
+        """
+        Yields the same lines as iteration over the filter, encoded in UTF-8.
+
+        When the file is searched as raw bytes, ASCII lines are passed through
+        as they are, without decoding and encoding them again.
+
+        Yields:
+            bytes: The filtered lines containing the keyword with line numbers.
+        """
+        if self.bytes_pattern is None:
+            for line in self:
+                yield line.encode('utf-8')
+            return
+
+        yield from encode_matched_lines(matched_lines_mapped(self.file_name, self.bytes_pattern), self.encoding)
+
 
-def save_filtered_lines(input_file: str, output_file: str, keyword: str = 'Error') -> None:
+def save_filtered_lines(input_file: str, output_file: str, keyword: str = 'Error',
+                        keywords: Optional[List[str]] = None) -> None:
     """
     Reads a file, filters lines containing a specific keyword, and writes them to a new file.
 
@@ -43,10 +116,10 @@ def save_filtered_lines(input_file: str, output_file: str, keyword: str = 'Error
         input_file (str): The path to the input file.
         output_file (str): The path to the output file.
         keyword (str): The keyword to filter lines.
+        keywords (Optional[List[str]]): More keywords to filter lines.
     """
-    with open(output_file, 'w', encoding='utf-8') as output:
-        for line in KeywordLineFilter(input_file, keyword):
-            output.write(line + '\n')
+    # The lines come already encoded in UTF-8, so the output is written in binary mode
+    write_lines(output_file, KeywordLineFilter(input_file, keyword, keywords=keywords).iter_encoded())
 
 
 def get_file_from_directory() -> tuple[str, str, str]:
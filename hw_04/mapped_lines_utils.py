@@ -0,0 +1,103 @@
+import mmap
+import os
+import re
+from typing import Iterable, Iterator
+
+WRITE_BATCH = 4096  # Filtered lines written per write() call
+# The characters str.strip() removes from an ASCII line
+ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+def matched_lines_mapped(file_name: str, pattern: re.Pattern) -> Iterator[tuple[int, bytes]]:
+    """
+    Searches the memory-mapped file as raw bytes for the lines matching a pattern.
+
+    Lines end with '\\n', '\\r\\n' or '\\r', as in text mode, and line numbers
+    are found by counting the line breaks between matches. A match must not
+    start with a line break, it may end with one.
+
+    Args:
+        file_name (str): The path to the file.
+        pattern (re.Pattern): The compiled bytes pattern to search for.
+
+    Yields:
+        tuple[int, bytes]: The line number and the line without its line break.
+    """
+    search = pattern.search
+    with open(file_name, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # Empty files cannot be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(data, "madvise"):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            size = len(data)
+            has_cr = data.find(b"\r") != -1  # Without '\r' only '\n' ends a line
+            line_number = 1
+            position = 0  # Start of the line that line_number refers to
+            while True:
+                match = search(data, position)
+                if match is None:
+                    break
+                if has_cr:
+                    line_start = max(data.rfind(b"\n", position, match.start()),
+                                     data.rfind(b"\r", position, match.start())) + 1
+                else:
+                    line_start = data.rfind(b"\n", position, match.start()) + 1
+                if line_start:
+                    # Newlines are counted in C over the gap since the previous match
+                    gap = data[position:line_start]
+                    line_number += gap.count(b"\n")
+                    if has_cr:
+                        line_number += gap.count(b"\r") - gap.count(b"\r\n")
+                else:
+                    line_start = position
+                line_end = min(end for end in (data.find(b"\n", match.start()),
+                                               data.find(b"\r", match.start()) if has_cr else -1,
+                                               size) if end >= 0)
+
+                yield line_number, data[line_start:line_end]
+
+                # Continue after the matched line and its line break
+                position = line_end + (2 if data[line_end:line_end + 2] == b"\r\n" else 1)
+                line_number += 1
+
+
+def encode_matched_lines(matched_lines: Iterable[tuple[int, bytes]], encoding: str) -> Iterator[bytes]:
+    """
+    Formats numbered raw lines as 'Line N: text' in UTF-8, stripped like str.strip().
+
+    ASCII lines are passed through as they are, without decoding and encoding them again.
+
+    Args:
+        matched_lines (Iterable[tuple[int, bytes]]): Line numbers and raw lines.
+        encoding (str): The encoding of the raw lines.
+
+    Yields:
+        bytes: The formatted lines.
+    """
+    for line_number, line in matched_lines:
+        if line.isascii():
+            line = line.strip(ASCII_WHITESPACE)
+        else:
+            line = line.decode(encoding, errors="replace").strip().encode("utf-8")
+        yield b"Line %d: %s" % (line_number, line)
+
+
+def write_lines(output_file: str, lines: Iterable[bytes]) -> None:
+    """
+    Writes UTF-8 encoded lines to a file, each followed by a line break.
+
+    Args:
+        output_file (str): The path to the output file.
+        lines (Iterable[bytes]): The lines without line breaks.
+    """
+    with open(output_file, "wb", buffering=1 << 20) as output:
+        # Lines are joined into one string per batch, so each batch is a single write() call
+        batch: list[bytes] = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) >= WRITE_BATCH:
+                output.write(b"\n".join(batch) + b"\n")
+                batch.clear()
+        if batch:
+            output.write(b"\n".join(batch) + b"\n")
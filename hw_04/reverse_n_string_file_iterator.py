@@ -1,12 +1,21 @@
-from typing import Iterator, Optional
+import os
+import re
+from typing import Iterator, List, Optional
 from collections import deque
 
+LINE_BREAK_RE = re.compile(rb'\r\n|\r|\n')  # The line breaks of text mode (universal newlines)
+
 
 class ReversedNStringFileIterator:
     """
     Iterator for reading the last N lines of a file in reverse order.
+
+    Only the tail of the file is read, block by block from the end,
+    until N lines are found. Lines end with '\\n', '\\r\\n' or '\\r', as in text mode.
     """
 
+    BLOCK_SIZE: int = 64 * 1024
+
     def __init__(self, file_name: str, n: int = 10, encoding: str = 'utf-8') -> None:
         """
         Initializes the iterator.
@@ -21,6 +30,7 @@ class ReversedNStringFileIterator:
         self.encoding: str = encoding
         self.buffer: deque[str] = deque(maxlen=n)  # Buffer for storing the last N lines
         self.lines_read: int = 0
+        self.loaded: bool = False
 
     def __iter__(self) -> Iterator[str]:
         """
@@ -41,7 +51,7 @@ class ReversedNStringFileIterator:
         Raises:
             StopIteration: If there are no more lines to read.
         """
-        if not self.buffer:
+        if not self.loaded:
             self._read_lines()
 
         if self.lines_read >= self.n or not self.buffer:
@@ -52,12 +62,49 @@ class ReversedNStringFileIterator:
 
     def _read_lines(self) -> None:
         """
-        Reads lines from the file and adds them to the buffer in reverse order.
+        Reads the last N lines from the end of the file and adds them to the buffer,
+        so that the last line of the file is taken first.
         """
-        with open(self.file_name, 'r', encoding=self.encoding, errors='replace') as file:
-            # Reads a file line by line
-            for line in file:
-                self.buffer.append(line.strip())  # Add a string to the buffer
+        lines: List[bytes] = []  # Complete lines, starting from the last one
+        remainder = b''  # The beginning of a line that continues in the next block
+
+        with open(self.file_name, 'rb') as file:
+            position = file.seek(0, os.SEEK_END)
+            if position:
+                # A final line break does not start one more line
+                file.seek(max(position - 2, 0))
+                tail = file.read(2)
+                if tail.endswith(b'\r\n'):
+                    position -= 2
+                elif tail.endswith((b'\n', b'\r')):
+                    position -= 1
+
+                while position > 0 and len(lines) < self.n:
+                    size = min(self.BLOCK_SIZE, position)
+                    position -= size
+                    file.seek(position)
+                    block = file.read(size)
+                    if position and block.startswith(b'\n'):
+                        # Keep a '\r\n' split by the block boundary together
+                        file.seek(position - 1)
+                        if file.read(1) == b'\r':
+                            position -= 1
+                            block = b'\r' + block
+                    block += remainder
+                    parts = LINE_BREAK_RE.split(block) if b'\r' in block else block.split(b'\n')
+                    remainder = parts.pop(0)
+                    lines.extend(reversed(parts))
+
+                if position == 0:
+                    # The start of the file completes the first line
+                    lines.append(remainder)
+
+        # Decode only the lines that will be returned
+        self.buffer.extend(
+            line.decode(self.encoding, errors='replace').strip()
+            for line in reversed(lines[:self.n])
+        )
+        self.loaded = True
 
 
 # Example usage
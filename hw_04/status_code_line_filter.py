@@ -1,6 +1,8 @@
 import os
 import re
-from typing import Iterator, List
+from typing import Iterator
+
+from mapped_lines_utils import encode_matched_lines, matched_lines_mapped, write_lines
 
 
 class StatusCodeLineFilter:
@@ -19,6 +21,12 @@ class StatusCodeLineFilter:
         """
         self.file_name: str = file_name
         self.encoding: str = encoding
+        # The pattern works on the raw bytes, so it matches the ASCII whitespace that
+        # \s matches in text (including '\x1c'-'\x1f'), but not non-ASCII whitespace
+        # such as a no-break space. The leading whitespace must not be a line break,
+        # so a code at the start of a line is not matched together with the end of
+        # the previous line
+        self.status_code_pattern: re.Pattern = re.compile(rb"[ \t\x0b\x0c\x1c-\x1f][45]\d{2}[\s\x1c-\x1f]")
 
     def __iter__(self) -> Iterator[str]:
         """
@@ -27,12 +35,32 @@ class StatusCodeLineFilter:
         Yields:
             str: Filtered lines containing 4XX or 5XX status codes with their line numbers.
         """
-        status_code_pattern = re.compile(r"\s[45]\d{2}\s")
+        for line_number, line in self._matched_lines():
+            yield f"Line {line_number}: {line.decode(self.encoding, errors='replace').strip()}"
+
+    def iter_encoded(self) -> Iterator[bytes]:
+        """
+        Yields the same lines as iteration over the filter, encoded in UTF-8.
+
+        ASCII lines are passed through as they are, without decoding and encoding them again.
+
+        Yields:
+            bytes: Filtered lines containing 4XX or 5XX status codes with their line numbers.
+        """
+        return encode_matched_lines(self._matched_lines(), self.encoding)
+
+    def _matched_lines(self) -> Iterator[tuple[int, bytes]]:
+        """
+        Finds the lines with 4XX or 5XX status codes in the raw bytes of the file.
+
+        The file is memory-mapped and searched as raw bytes, errors are reported
+        and end the search.
+
+        Yields:
+            tuple[int, bytes]: The line number and the line without its line break.
+        """
         try:
-            with open(self.file_name, "r", encoding=self.encoding, errors="replace") as file:
-                for line_number, line in enumerate(file, start=1):
-                    if status_code_pattern.search(line):
-                        yield f"Line {line_number}: {line.strip()}"
+            yield from matched_lines_mapped(self.file_name, self.status_code_pattern)
         except FileNotFoundError:
             print(f"Error: File '{self.file_name}' not found.")
         except Exception as e:
@@ -49,9 +77,8 @@ def save_filtered_lines(input_file: str, output_file: str) -> None:
         output_file (str): The path to the output file.
     """
     try:
-        with open(output_file, "w", encoding="utf-8") as output:
-            for line in StatusCodeLineFilter(input_file):
-                output.write(line + "\n")
+        # The lines come already encoded in UTF-8, so the output is written in binary mode
+        write_lines(output_file, StatusCodeLineFilter(input_file).iter_encoded())
     except Exception as e:
         print(f"Error writing to file '{output_file}': {e}")
 
@@ -1,12 +1,17 @@
-import uuid
-from typing import Iterator
+import os
+from typing import Iterator, List
 
 
 class UniqueIdentifierIterator:
     """
-    Iterator for generating unique identifiers.
+    Iterator for generating unique identifiers (random UUID version 4 strings).
+
+    Random bytes are taken from the OS in batches, so one system call
+    serves many identifiers.
     """
 
+    BATCH_SIZE: int = 1024
+
     def __init__(self, count: int) -> None:
         """
         Initialize the iterator.
@@ -21,6 +26,7 @@ class UniqueIdentifierIterator:
             raise ValueError("Count must be a non-negative integer.")
         self.count: int = count
         self.generated: int = 0
+        self.batch: List[str] = []
 
     def __iter__(self) -> Iterator[str]:
         """
@@ -44,9 +50,34 @@ class UniqueIdentifierIterator:
         if self.generated >= self.count:
             raise StopIteration
 
-        unique_id = str(uuid.uuid4())  # Generate a unique UUID
+        if not self.batch:
+            self.batch = self._generate_batch(min(self.BATCH_SIZE, self.count - self.generated))
+
         self.generated += 1
-        return unique_id
+        return self.batch.pop()
+
+    @staticmethod
+    def _generate_batch(size: int) -> List[str]:
+        """
+        Generate several UUID version 4 strings from one block of random bytes.
+
+        Args:
+            size (int): The number of identifiers to generate.
+
+        Returns:
+            List[str]: The generated identifiers.
+        """
+        raw = bytearray(os.urandom(16 * size))
+        for offset in range(0, len(raw), 16):
+            raw[offset + 6] = (raw[offset + 6] & 0x0F) | 0x40  # Version 4
+            raw[offset + 8] = (raw[offset + 8] & 0x3F) | 0x80  # RFC 4122 variant
+
+        hex_str = raw.hex()
+        return [
+            f"{hex_str[i:i + 8]}-{hex_str[i + 8:i + 12]}-{hex_str[i + 12:i + 16]}-"
+            f"{hex_str[i + 16:i + 20]}-{hex_str[i + 20:i + 32]}"
+            for i in range(0, len(hex_str), 32)
+        ]
 
 
 if __name__ == "__main__":
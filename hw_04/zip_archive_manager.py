@@ -3,6 +3,12 @@ import zipfile
 from typing import Optional, List
 from datetime import datetime
 
+BUFFER_SIZE = 1 << 20  # 1 MiB output buffer for writing the archive
+# Files that are smaller or already compressed are stored without compression
+STORE_BELOW_SIZE = 4096
+COMPRESSED_EXTENSIONS = frozenset(('.zip', '.gz', '.bz2', '.xz', '.7z', '.rar',
+                                   '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.mp4'))
+
 
 def get_file_for_zip() -> tuple[str, str]:
     """
@@ -21,8 +27,9 @@ def get_file_for_zip() -> tuple[str, str]:
         print("Error: Invalid directory path.")
         exit()
 
-    available_files = [f for f in os.listdir(file_directory) if
-                       os.path.isfile(os.path.join(file_directory, f))]
+    # DirEntry.is_file() uses the file type returned with the listing, no extra stat per entry
+    with os.scandir(file_directory) as entries:
+        available_files = [entry.name for entry in entries if entry.is_file()]
 
     if not available_files:
         print("Error: No files found in the selected directory.")
@@ -63,15 +70,20 @@ class ZipArchiveManager:
     Context manager that adds files to a ZIP archive, ensuring the archive is properly closed when exiting the context.
     """
 
-    def __init__(self, zip_name: str) -> None:
+    def __init__(self, zip_name: str, compresslevel: int = 1, method: int = zipfile.ZIP_DEFLATED) -> None:
         """
         Initializes the ZIP archive manager.
 
         Args:
             zip_name (str): The name of the ZIP archive to be created.
+            compresslevel (int): The compression level. Defaults to 1, the fastest.
+            method (int): The compression method. Defaults to zipfile.ZIP_DEFLATED.
         """
         self.zip_name = zip_name
+        self.compresslevel = compresslevel
+        self.method = method
         self.zip_file = None
+        self.raw_file = None
 
     def __enter__(self) -> "ZipArchiveManager":
         """
@@ -80,7 +92,8 @@ class ZipArchiveManager:
         Returns:
             ZipArchiveManager: The instance of the context manager.
         """
-        self.zip_file = zipfile.ZipFile(self.zip_name, 'w', zipfile.ZIP_DEFLATED)
+        self.raw_file = open(self.zip_name, 'wb', buffering=BUFFER_SIZE)
+        self.zip_file = zipfile.ZipFile(self.raw_file, 'w', self.method, compresslevel=self.compresslevel)
         return self
 
     def add_file(self, file_path: str) -> None:
@@ -93,8 +106,15 @@ class ZipArchiveManager:
         if self.zip_file is None:
             raise RuntimeError("ZIP archive is not open.")
 
-        if os.path.exists(file_path) and os.path.isfile(file_path):
-            self.zip_file.write(file_path, os.path.split(file_path)[1])  # Add the file to the archive
+        if os.path.isfile(file_path):
+            if (os.path.getsize(file_path) < STORE_BELOW_SIZE
+                    or os.path.splitext(file_path)[1].lower() in COMPRESSED_EXTENSIONS):
+                compress_type = zipfile.ZIP_STORED  # Compression would gain next to nothing
+            else:
+                compress_type = self.zip_file.compression
+            # The archive is written through the 1 MiB buffer of raw_file
+            self.zip_file.write(file_path, os.path.basename(file_path),
+                                compress_type=compress_type, compresslevel=self.compresslevel)
         else:
             print(f"Warning: File '{file_path}' does not exist or is not a file.")
 
@@ -103,7 +123,10 @@ class ZipArchiveManager:
         Closes the ZIP archive upon exiting the context.
         """
         if self.zip_file:
-            self.zip_file.close()
+            try:
+                self.zip_file.close()
+            finally:
+                self.raw_file.close()
             print(f"ZIP archive '{self.zip_name}' has been created successfully.")
 
 
@@ -1,10 +1,17 @@
 import csv
-from typing import List, Dict, Union
+from typing import List, NamedTuple
 from get_file_from_directory import get_file_from_directory
 
 
+class Student(NamedTuple):
+    """A student record read from the CSV file."""
+    name: str
+    age: int
+    grade: int
+
+
 # Function to read data from a CSV file
-def read_students(fn: str) -> List[Dict[str, Union[str, int]]]:
+def read_students(fn: str) -> List[Student]:
     students = []
     max_attempts = 3
     attempt_count = 0
@@ -12,13 +19,16 @@ def read_students(fn: str) -> List[Dict[str, Union[str, int]]]:
     while attempt_count < max_attempts:
         try:
             with open(fn, mode='r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
+                reader = csv.reader(file)
+                # The column positions are looked up once in the header, not per row
+                header = next(reader, [])
+                name_i = header.index("Ім'я")
+                age_i = header.index('Вік')
+                grade_i = header.index('Оцінка')
                 for row in reader:
-                    students.append({
-                        "Ім'я": row["Ім'я"],
-                        'Вік': int(row['Вік']),
-                        'Оцінка': int(row['Оцінка'])
-                    })
+                    if not row:
+                        continue  # Skip blank lines, as csv.DictReader does
+                    students.append(Student(row[name_i], int(row[age_i]), int(row[grade_i])))
             break  # If the file is successfully opened, exit the loop
         except FileNotFoundError:
             attempt_count += 1
@@ -28,7 +38,7 @@ def read_students(fn: str) -> List[Dict[str, Union[str, int]]]:
             else:
                 print("Error: Maximum attempts reached. File could not be found.")
                 break  # If the maximum number of attempts is reached, exit the cycle
-        except (KeyError, ValueError) as e:
+        except (IndexError, ValueError) as e:
             print(f"Error reading '{fn}': {e}")
             break  # If there is an error in the file (for example, incorrect data), exit the loop
 
@@ -36,9 +46,15 @@ def read_students(fn: str) -> List[Dict[str, Union[str, int]]]:
 
 
 # Function to calculate the average grade
-def avg_grade(students: List[Dict[str, Union[str, int]]]) -> float:
-    grades = [student['Оцінка'] for student in students if isinstance(student['Оцінка'], int)]
-    return sum(grades) / len(grades) if grades else 0.0
+def avg_grade(students: List[Student]) -> float:
+    # Summed while counting, without collecting the grades in a list first
+    total = 0
+    count = 0
+    for student in students:
+        if isinstance(student.grade, int):
+            total += student.grade
+            count += 1
+    return total / count if count else 0.0
 
 
 # Function to add a new student to the CSV file
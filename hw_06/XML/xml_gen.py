@@ -59,9 +59,10 @@ class ProductXMLGenerator:
         Args:
             None
         """
-        tree: etree.ElementTree = etree.ElementTree(self.root)
+        # Serialized in one call and written in one write()
+        data: bytes = etree.tostring(self.root, pretty_print=True, xml_declaration=True, encoding="UTF-8")
         with open(self.filename, "wb") as f:
-            tree.write(f, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+            f.write(data)
 
         print(f"File '{self.filename}' has been saved.")
 
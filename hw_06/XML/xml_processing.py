@@ -1,76 +1,100 @@
 from lxml import etree
 from get_file_from_directory import get_file_from_directory
 
+# One parser for all files: whitespace-only text is dropped, so the tree is smaller
+# and pretty_print indents it anew, and no ID table is kept during parsing
+XML_PARSER = etree.XMLParser(remove_blank_text=True, collect_ids=False, huge_tree=False, resolve_entities=False)
+# Compiled once: selects the products whose name equals the $name variable
+PRODUCT_BY_NAME = etree.XPath("product[name = $name]")
+
+
+def print_products(root: etree._Element) -> None:
+    """
+    Displays the names and quantities of the products in a parsed XML tree.
+
+    Args:
+        root (etree._Element): The root element of the products XML tree.
+    """
+    print("\nAvailable Products:")
+    for i, product in enumerate(root.iterfind("product"), 1):
+        # One walk over the children instead of a find() per field
+        name: str = "Unknown"
+        quantity: str = "0"
+        for child in product:
+            if child.tag == "name":
+                name = child.text or name
+            elif child.tag == "quantity":
+                quantity = child.text or quantity
+        print(f"{i}. Product: {name}, Quantity in stock: {quantity}")
+
 
 def read_products(fn: str) -> None:
     """
     Reads an XML file and displays the names and quantities of products.
 
+    The file is streamed with iterparse, and every product is removed from
+    memory once it is printed, so the whole tree is never built.
+
     Args:
         fn (str): The filename of the XML file.
     """
     try:
-        tree = etree.parse(fn)
-        root = tree.getroot()
-
         print("\nAvailable Products:")
-        for i, product in enumerate(root.findall("product"), 1):
-            name: str = product.find("name").text or "Unknown"
-            quantity: str = product.find("quantity").text or "0"
+        products = etree.iterparse(fn, events=("end",), tag="product",
+                                   remove_blank_text=True, resolve_entities=False)
+        for i, (_, product) in enumerate(products, 1):
+            name: str = product.findtext("name") or "Unknown"
+            quantity: str = product.findtext("quantity") or "0"
             print(f"{i}. Product: {name}, Quantity in stock: {quantity}")
+            # Free the product and the already processed siblings before it
+            product.clear(keep_tail=True)
+            while product.getprevious() is not None:
+                del product.getparent()[0]
     except Exception as e:
         print(f"Error reading the XML file: {e}")
 
 
-def update_product_info(fn: str, product_name: str, field: str, new_value: str | int | float) -> None:
+def update_product_info(root: etree._Element, product_name: str, field: str, new_value: str | int | float) -> None:
     """
-    Updates a specified field of a product in the XML file.
+    Updates a specified field of a product in the parsed XML tree.
+
+    The tree is changed in memory only, the caller writes it to the file.
 
     Args:
-        fn (str): The filename of the XML file.
+        root (etree._Element): The root element of the products XML tree.
         product_name (str): The name of the product to update.
         field (str): The field to update ("name", "price", or "quantity").
         new_value (str | int | float): The new value to be assigned.
     """
     try:
-        tree = etree.parse(fn)
-        root = tree.getroot()
-
-        for product in root.findall("product"):
-            name_element = product.find("name")
-            if name_element is not None and name_element.text == product_name:
-                if field == "name":
-                    name_element.text = str(new_value)
-                elif field == "price":
-                    price_element = product.find("price")
-                    if price_element is not None:
-                        price_element.text = str(new_value)
-                elif field == "quantity":
-                    quantity_element = product.find("quantity")
-                    if quantity_element is not None:
-                        quantity_element.text = str(new_value)
-
-                break
-
-        tree.write(fn, pretty_print=True, xml_declaration=True, encoding="utf-8")
+        # The product is selected by the XPath predicate, then only the one field is looked up
+        products = PRODUCT_BY_NAME(root, name=product_name)
+        if products and field in ("name", "price", "quantity"):
+            field_element = products[0].find(field)
+            if field_element is not None:
+                field_element.text = str(new_value)
         print(f"Product '{product_name}' has been updated.")
     except Exception as e:
-        print(f"Error updating the XML file: {e}")
+        print(f"Error updating the product: {e}")
 
 
 def modify_product(fn: str) -> None:
     """
     Allows the user to modify product details interactively.
 
+    The file is parsed once, all changes are made in memory, and the file
+    is written once at the end if anything was changed.
+
     Args:
         fn (str): The filename of the XML file.
     """
     try:
-        tree = etree.parse(fn)
+        tree = etree.parse(fn, XML_PARSER)
         root = tree.getroot()
+        modified = False
 
         while True:
-            read_products(fn)
+            print_products(root)
             try:
                 product_index: int = int(input("\nEnter the product number to modify (0 to exit): "))
                 if product_index == 0:
@@ -100,7 +124,10 @@ def modify_product(fn: str) -> None:
                             print("Invalid value for price or quantity. Please enter a number.")
                             continue
 
-                    update_product_info(fn, product_name, field, new_value)
+                    update_product_info(root, product_name, field, new_value)
+                    modified = True
+                    if field == "name":
+                        product_name = str(new_value)  # Later changes look the product up by its new name
 
                     cont_change: str = input(
                         f"Do you want to modify another field for {product_name}? (yes/no): "
@@ -115,8 +142,12 @@ def modify_product(fn: str) -> None:
             except ValueError:
                 print("Invalid input, please enter a valid product number.")
 
+        if modified:
+            tree.write(fn, pretty_print=True, xml_declaration=True, encoding="utf-8")
+            print(f"Changes have been saved to '{fn}'.")
+
         print("\nUpdated product list:")
-        read_products(fn)
+        print_products(root)
     except Exception as e:
         print(f"Error processing the XML file: {e}")
 